@@ -3,36 +3,69 @@
 This module contains the implementation of all CLI commands.
 """
 
+import logging
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich import print as rprint
-from rich.console import Console
 
 from getyuhratescli.config import (
+    DEFAULT_CONFIG_PATH,
+    DEFAULT_ENV_PATH,
     load_config,
     load_env_file,
     validate_config,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_SEP = "=" * 60
+
 config_app = typer.Typer(help="Configuration management commands")
 
 
+@cache
+def get_console() -> "Console":
+    """Get the shared console used for all command output.
+
+    Rich is imported on first use rather than at module import, so invoking
+    the CLI for help or shell completion does not pay for it.
+
+    Returns:
+        Console: The shared Rich console.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
 @config_app.command("test")
 def test_config(
     config_path: Path = typer.Option(
-        Path.cwd() / "config.yaml",
+        DEFAULT_CONFIG_PATH,
         "--config",
         "-c",
         help="Path to config.yaml file",
     ),
     env_path: Path = typer.Option(
-        Path.cwd() / ".env",
+        DEFAULT_ENV_PATH,
         "--env",
         "-e",
         help="Path to .env file",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Parse config.yaml again instead of using the cached copy",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Fully re-check config.yaml even if unchanged since it last passed",
+    ),
 ) -> None:
     """Test and validate configuration files.
 
@@ -42,25 +75,30 @@ def test_config(
     Args:
         config_path: Path to config.yaml file.
         env_path: Path to .env file.
+        no_cache: Whether to bypass the cached parse of config.yaml.
+        force: Whether to re-check config.yaml even if it is unchanged.
 
     Returns:
         None: Prints validation results to console.
     """
-    rprint("\n[bold blue]Testing GetYuhRates Configuration[/bold blue]\n")
-    rprint("=" * 60)
+    console = get_console()
+    console.print("\n[bold blue]Testing GetYuhRates Configuration[/bold blue]\n")
+    console.print(_SEP)
 
-    success, message = validate_config(config_path, env_path)
+    success, message, _ = validate_config(
+        config_path, env_path, use_cache=not no_cache, force=force
+    )
 
     if success:
-        rprint("\n[bold green]Configuration Test Passed![/bold green]\n")
-        rprint(message)
-        rprint("\n" + "=" * 60)
-        rprint("[bold green]All checks passed successfully![/bold green]\n")
+        console.print("\n[bold green]Configuration Test Passed![/bold green]\n")
+        console.print(message)
+        console.print("\n" + _SEP)
+        console.print("[bold green]All checks passed successfully![/bold green]\n")
     else:
-        rprint("\n[bold red]Configuration Test Failed![/bold red]\n")
-        rprint(message)
-        rprint("\n" + "=" * 60)
-        rprint("[bold red]Please fix the errors above and try again.[/bold red]\n")
+        console.print("\n[bold red]Configuration Test Failed![/bold red]\n")
+        console.print(message)
+        console.print("\n" + _SEP)
+        console.print("[bold red]Please fix the errors above and try again.[/bold red]\n")
         raise typer.Exit(code=1)
 
 
@@ -87,13 +125,24 @@ def get_rates_command(
         None,
         "--writer",
         "-w",
-        help="Output writer type (CSV or PDF)",
+        help="Output writer type (CSV, PARQUET or PDF)",
     ),
     config_path: Path = typer.Option(
-        Path.cwd() / "config.yaml",
+        DEFAULT_CONFIG_PATH,
         "--config",
         help="Path to config.yaml file",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Parse config.yaml again instead of using the cached copy",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show details such as rate limit waits while fetching",
+    ),
 ) -> None:
     """Get currency exchange rates from CurrencyLayer API.
 
@@ -106,35 +155,47 @@ def get_rates_command(
         output_path: Output folder path. If None, uses config file value.
         writer: Output writer type. If None, uses config file value.
         config_path: Path to config.yaml file.
+        no_cache: Whether to bypass the cached parse of config.yaml.
+        verbose: Whether to show debug messages from the getyuhrates package.
 
     Returns:
         None: Writes output files and prints results to console.
     """
+    console = get_console()
+
+    if verbose:
+        logging.basicConfig(format="%(message)s")
+        logging.getLogger("getyuhrates").setLevel(logging.DEBUG)
+
     # Load environment variables
     load_env_file()
 
     # Load configuration
     try:
-        config = load_config(config_path)
+        config = load_config(config_path, use_cache=not no_cache)
     except Exception as e:
-        rprint(f"[bold red]Error loading configuration:[/bold red] {e}")
+        console.print(f"[bold red]Error loading configuration:[/bold red] {e}")
         raise typer.Exit(code=1)
 
     # Override config with command-line arguments
-    final_sources = source if source is not None else config["source"]
-    final_currencies = currencies if currencies is not None else config["currencies"]
+    final_sources = source if source is not None else list(config["source"])
+    final_currencies = (
+        currencies if currencies is not None else list(config["currencies"])
+    )
     final_output_path = (
         str(output_path) if output_path is not None else config["output_folder"]
     )
     final_writer = writer if writer is not None else config["output_format"]
+    sources_str = ", ".join(final_sources)
+    currencies_str = ", ".join(final_currencies)
 
-    rprint("\n[bold blue]GetYuhRates - Fetching Currency Rates[/bold blue]\n")
-    rprint("=" * 60)
-    rprint(f"[cyan]Source currencies:[/cyan] {', '.join(final_sources)}")
-    rprint(f"[cyan]Target currencies:[/cyan] {', '.join(final_currencies)}")
-    rprint(f"[cyan]Output path:[/cyan] {final_output_path}")
-    rprint(f"[cyan]Writer type:[/cyan] {final_writer}")
-    rprint("=" * 60 + "\n")
+    console.print("\n[bold blue]GetYuhRates - Fetching Currency Rates[/bold blue]\n")
+    console.print(_SEP)
+    console.print(f"[cyan]Source currencies:[/cyan] {sources_str}")
+    console.print(f"[cyan]Target currencies:[/cyan] {currencies_str}")
+    console.print(f"[cyan]Output path:[/cyan] {final_output_path}")
+    console.print(f"[cyan]Writer type:[/cyan] {final_writer}")
+    console.print(_SEP + "\n")
 
     try:
         # Import the getyuhrates package
@@ -148,16 +209,22 @@ def get_rates_command(
         # Determine writer instance
         if final_writer.upper() == "CSV":
             writer_instance = CSVWriter()
+        elif final_writer.upper() == "PARQUET":
+            from getyuhrates.parquet_writer import (  # type: ignore[import-not-found]
+                ParquetWriter,
+            )
+
+            writer_instance = ParquetWriter()
         else:
-            rprint(
+            console.print(
                 f"[bold yellow]Warning:[/bold yellow] {final_writer} writer not yet implemented, using CSV"
             )
             writer_instance = CSVWriter()
 
         # Fetch rates for each source currency with rate limiting
-        rprint("[bold]Fetching rates...[/bold]\n")
+        console.print("[bold]Fetching rates...[/bold]\n")
 
-        rprint(f"[cyan]Fetching rates for {final_sources}...[/cyan]")
+        console.print(f"[cyan]Fetching rates for {sources_str}...[/cyan]")
 
         # Call get_rates for this specific source
         results = client.get_rates(
@@ -168,24 +235,24 @@ def get_rates_command(
         )
 
         # Display results
-        rprint("\n[bold green]Results:[/bold green]\n")
+        console.print("\n[bold green]Results:[/bold green]\n")
         for result in results:
-            if result["success"]:
-                rprint(f"[green]Success:[/green] {result['source']}")
-                if result.get("file_location"):
-                    rprint(f"  [dim]File saved to: {result['file_location']}[/dim]")
+            if result.success:
+                console.print(f"[green]Success:[/green] {result.source}")
+                if result.file_location:
+                    console.print(f"  [dim]File saved to: {result.file_location}[/dim]")
             else:
-                rprint(f"[red]Failed:[/red] {result['source']}")
-                if result.get("reason"):
-                    rprint(f"  [dim]Reason: {result['reason']}[/dim]")
+                console.print(f"[red]Failed:[/red] {result.source}")
+                if result.reason:
+                    console.print(f"  [dim]Reason: {result.reason}[/dim]")
 
-        rprint("\n[bold green]Done![/bold green]\n")
+        console.print("\n[bold green]Done![/bold green]\n")
 
     except ImportError as e:
-        rprint(f"[bold red]Error:[/bold red] Could not import getyuhrates package: {e}")
-        rprint("\nMake sure the getyuhrates package is installed:")
-        rprint("  [cyan]pip install -e ../getyuhrates_package[/cyan]\n")
+        console.print(f"[bold red]Error:[/bold red] Could not import getyuhrates package: {e}")
+        console.print("\nMake sure the getyuhrates package is installed:")
+        console.print("  [cyan]pip install -e ../getyuhrates_package[/cyan]\n")
         raise typer.Exit(code=1)
     except Exception as e:
-        rprint(f"[bold red]Error fetching rates:[/bold red] {e}")
+        console.print(f"[bold red]Error fetching rates:[/bold red] {e}")
         raise typer.Exit(code=1)
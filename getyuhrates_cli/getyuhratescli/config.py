@@ -4,13 +4,24 @@ This module handles loading and validating configuration from config.yaml
 and environment variables from .env files.
 """
 
+import json
 import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import TypedDict
+from types import MappingProxyType
+from typing import Any, Literal, Protocol, TypedDict, overload
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader; it is much faster than the pure-Python one.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class Config(TypedDict):
     """Configuration structure for GetYuhRates CLI.
@@ -40,12 +51,67 @@ class Config(TypedDict):
     email_body: str
 
 
+class ConfigView(Protocol):
+    """Read-only view of the configuration returned by load_config.
+
+    It has the same keys as Config, but list fields are tuples and the view
+    cannot be modified, since it is shared with every other caller.
+    """
+
+    @overload
+    def __getitem__(
+        self, key: Literal["source", "currencies", "recipients"], /
+    ) -> tuple[str, ...]: ...
+
+    @overload
+    def __getitem__(
+        self,
+        key: Literal[
+            "always_download",
+            "output_folder",
+            "output_format",
+            "sender_email",
+            "subject_title",
+            "email_body",
+        ],
+        /,
+    ) -> str: ...
+
+    @overload
+    def __getitem__(self, key: Literal["send_emails"], /) -> bool: ...
+
+
+# Default file locations, resolved against the working directory when opened.
+DEFAULT_CONFIG_PATH = Path("config.yaml")
+DEFAULT_ENV_PATH = Path(".env")
+
+# Fields that must be present in config.yaml, kept in sync with Config.
+_REQUIRED_FIELDS: frozenset[str] = Config.__required_keys__
+
+# Fields that must hold a YAML list, in the order they are checked.
+_LIST_FIELDS: tuple[str, ...] = ("source", "currencies", "recipients")
+
+# Parsed config.yaml contents keyed by path, tagged with the (mtime_ns, size)
+# of the file they were parsed from so edits invalidate the entry.
+_YAML_CACHE: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# mtime_ns of each .env file already loaded into os.environ, keyed by path.
+_ENV_LOADED: dict[str, int] = {}
+
+
 class ConfigLoadError(Exception):
     """Exception raised when configuration cannot be loaded."""
 
     pass
 
 
+class ConfigNotFoundError(ConfigLoadError):
+    """Exception raised when the configuration file does not exist."""
+
+    pass
+
+
 class ConfigValidationError(Exception):
     """Exception raised when configuration is invalid."""
 
@@ -55,6 +121,9 @@ class ConfigValidationError(Exception):
 def load_env_file(env_path: Path | None = None) -> None:
     """Load environment variables from .env file.
 
+    A file that has already been loaded in this process is skipped unless
+    it has been modified since.
+
     Args:
         env_path: Path to .env file. If None, searches for .env in current directory.
 
@@ -62,10 +131,28 @@ def load_env_file(env_path: Path | None = None) -> None:
         None: Environment variables are loaded into os.environ.
     """
     if env_path is None:
-        env_path = Path.cwd() / ".env"
+        env_path = DEFAULT_ENV_PATH
 
     if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
+        key = str(env_path)
+        mtime_ns = env_path.stat().st_mtime_ns
+        if _ENV_LOADED.get(key) == mtime_ns:
+            return
+
+        load_dotenv(dotenv_path=env_path, override=False)
+        _ENV_LOADED[key] = mtime_ns
+
+
+def invalidate_env_cache() -> None:
+    """Forget which .env files have been loaded.
+
+    The next call to load_env_file will re-read the file even if it has not
+    changed on disk.
+
+    Returns:
+        None: The loaded .env cache is cleared.
+    """
+    _ENV_LOADED.clear()
 
 
 def get_api_key() -> str:
@@ -86,115 +173,394 @@ def get_api_key() -> str:
     return api_key
 
 
-def load_config(config_path: Path | None = None) -> Config:
+def _write_atomic(path: str, text: str) -> None:
+    """Write a text file so readers never see it partially written.
+
+    The text is written to a temporary file in the same directory, which is
+    then moved into place.
+
+    Args:
+        path: Path of the file to create or replace.
+        text: Contents of the file.
+
+    Returns:
+        None: The file is written.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            _ = f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _sidecar_path(config_path: str) -> str:
+    """Get the path of the JSON cache file stored next to a YAML file.
+
+    Args:
+        config_path: Path to the YAML file.
+
+    Returns:
+        str: Path to the JSON sidecar, e.g. config.yaml.cache.json.
+    """
+    return config_path + ".cache.json"
+
+
+def _read_sidecar(config_path: str, st: os.stat_result) -> Any:
+    """Read the JSON sidecar for a YAML file if it is still current.
+
+    Args:
+        config_path: Path to the YAML file.
+        st: Result of os.stat on the YAML file.
+
+    Returns:
+        Any: The cached document, or None if there is no usable sidecar.
+    """
+    try:
+        with open(_sidecar_path(config_path), "r", encoding="utf-8") as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(sidecar, dict)
+        or sidecar.get("_yaml_mtime_ns") != st.st_mtime_ns
+        or sidecar.get("_yaml_size") != st.st_size
+    ):
+        return None
+    return sidecar.get("data")
+
+
+def _write_sidecar(config_path: str, st: os.stat_result, data: Any) -> None:
+    """Write the JSON sidecar for a YAML file.
+
+    The file is written with _write_atomic so readers never see a partial
+    sidecar. Failures are ignored; the sidecar is only an optimization.
+
+    Args:
+        config_path: Path to the YAML file.
+        st: Result of os.stat on the YAML file the data was parsed from.
+        data: The parsed YAML document.
+
+    Returns:
+        None: The sidecar is written if possible.
+    """
+    try:
+        payload = json.dumps(
+            {"_yaml_mtime_ns": st.st_mtime_ns, "_yaml_size": st.st_size, "data": data}
+        )
+    except (TypeError, ValueError):
+        # The YAML holds values JSON cannot represent (e.g. dates)
+        return
+
+    try:
+        _write_atomic(_sidecar_path(config_path), payload)
+    except OSError:
+        pass
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a parsed YAML document into an immutable one.
+
+    Args:
+        value: The parsed document or a value inside it.
+
+    Returns:
+        Any: The value with every list converted to a tuple and every
+            dictionary wrapped in a read-only MappingProxyType.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Build a modifiable copy of a document converted by _freeze.
+
+    Args:
+        value: The frozen document or a value inside it.
+
+    Returns:
+        Any: A copy with every mapping converted back to a dictionary and
+            every tuple back to a list.
+    """
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _load_yaml_cached(
+    config_path: str, st: os.stat_result, use_cache: bool = True
+) -> Any:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged.
+
+    Parses are cached in memory for the life of the process and in a JSON
+    sidecar next to the file, so later CLI invocations can skip YAML parsing.
+    Both caches are keyed by path and invalidated when the file's mtime or
+    size changes. The cached document is converted with _freeze once, when
+    it is cached, so it can be returned to every caller without copying.
+
+    Args:
+        config_path: Path to the YAML file.
+        st: Result of os.stat on the file, used as the cache validator.
+        use_cache: Whether cached parses may be used. When False the file is
+            always parsed, and the caches are refreshed with the result.
+
+    Returns:
+        Any: The parsed YAML document, made immutable by _freeze.
+    """
+    key = config_path
+
+    if use_cache:
+        cached = _YAML_CACHE.get(key)
+        if (
+            cached is not None
+            and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size
+        ):
+            _YAML_CACHE.move_to_end(key)
+            return cached[2]
+
+    config_data = _read_sidecar(config_path, st) if use_cache else None
+    if config_data is None:
+        with open(config_path, "r") as f:
+            config_data = yaml.load(f, Loader=_Loader)
+        _write_sidecar(config_path, st, config_data)
+
+    config_data = _freeze(config_data)
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, config_data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _ = _YAML_CACHE.popitem(last=False)
+
+    return config_data
+
+
+@overload
+def load_config(
+    config_path: Path | None = None,
+    mutable: Literal[False] = False,
+    use_cache: bool = True,
+) -> ConfigView: ...
+
+
+@overload
+def load_config(
+    config_path: Path | None = None, *, mutable: Literal[True], use_cache: bool = True
+) -> Config: ...
+
+
+def load_config(
+    config_path: Path | None = None, mutable: bool = False, use_cache: bool = True
+) -> ConfigView | Config:
     """Load configuration from config.yaml file.
 
+    By default the configuration is returned as a read-only view over the
+    cached parse, avoiding a copy on every call; its list fields are tuples.
+    Callers that need to modify the configuration must pass mutable=True to
+    get their own copy, with lists.
+
     Args:
         config_path: Path to config.yaml file. If None, uses config.yaml in current directory.
+        mutable: Whether to return a private, modifiable copy of the configuration.
+        use_cache: Whether a cached parse of config.yaml may be used. Pass False
+            to force the YAML file to be parsed again.
 
     Returns:
-        Config: Loaded and validated configuration.
+        ConfigView | Config: Loaded and validated configuration. A read-only
+            ConfigView unless mutable is True.
 
     Raises:
+        ConfigNotFoundError: If config file does not exist.
         ConfigLoadError: If config file cannot be loaded.
         ConfigValidationError: If config file is missing required fields.
     """
     if config_path is None:
-        config_path = Path.cwd() / "config.yaml"
+        config_path = DEFAULT_CONFIG_PATH
 
-    if not config_path.exists():
-        raise ConfigLoadError(
+    # A single stat both checks existence and validates the YAML cache
+    path = os.fspath(config_path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise ConfigNotFoundError(
             f"Configuration file not found: {config_path}\n"
             "Please create a config.yaml file based on config.yaml.example"
         )
 
     try:
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml_cached(path, st, use_cache)
     except yaml.YAMLError as e:
         raise ConfigLoadError(f"Invalid YAML in config file: {e}")
     except Exception as e:
         raise ConfigLoadError(f"Error reading config file: {e}")
 
-    if not isinstance(config_data, dict):
+    if not isinstance(config_data, MappingProxyType):
         raise ConfigValidationError("Config file must contain a YAML object/dictionary")
 
     # Validate required fields
-    required_fields = [
-        "source",
-        "currencies",
-        "always_download",
-        "output_folder",
-        "output_format",
-        "send_emails",
-        "sender_email",
-        "recipients",
-        "subject_title",
-        "email_body",
-    ]
-
-    missing_fields = [field for field in required_fields if field not in config_data]
+    missing_fields = _REQUIRED_FIELDS - config_data.keys()
     if missing_fields:
         raise ConfigValidationError(
-            f"Missing required fields in config.yaml: {', '.join(missing_fields)}"
+            f"Missing required fields in config.yaml: {', '.join(sorted(missing_fields))}"
         )
 
     # Validate field types
-    if not isinstance(config_data["source"], list):
-        raise ConfigValidationError("'source' must be a list")
-    if not isinstance(config_data["currencies"], list):
-        raise ConfigValidationError("'currencies' must be a list")
-    if not isinstance(config_data["recipients"], list):
-        raise ConfigValidationError("'recipients' must be a list")
+    # YAML lists were converted to tuples when the parse was cached
+    for field in _LIST_FIELDS:
+        if not isinstance(config_data[field], tuple):
+            raise ConfigValidationError(f"'{field}' must be a list")
+
+    if mutable:
+        config: Config = _thaw(config_data)
+        return config
+    view: ConfigView = config_data
+    return view
 
-    return config_data  # type: ignore[return-value]
+
+def _validation_marker_path(config_path: Path) -> str:
+    """Get the path of the marker recording a successful validation.
+
+    Args:
+        config_path: Path to config.yaml file.
+
+    Returns:
+        str: Path to the marker, e.g. config.yaml.validated.
+    """
+    return os.fspath(config_path) + ".validated"
+
+
+def _read_validation_marker(config_path: Path) -> list[str] | None:
+    """Get the summary recorded when config.yaml last passed validation.
+
+    Args:
+        config_path: Path to config.yaml file.
+
+    Returns:
+        list[str] | None: The recorded summary lines if config.yaml is unchanged
+            since it was validated, None otherwise.
+    """
+    try:
+        st = os.stat(config_path)
+        with open(_validation_marker_path(config_path), "r", encoding="utf-8") as f:
+            marker = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(marker, dict)
+        or marker.get("mtime") != st.st_mtime_ns
+        or marker.get("size") != st.st_size
+        or not isinstance(marker.get("summary"), list)
+    ):
+        return None
+    return marker["summary"]
+
+
+def _write_validation_marker(config_path: Path, summary: list[str]) -> None:
+    """Record that config.yaml passed validation in its current state.
+
+    The file is written with _write_atomic, so a crash while writing never
+    leaves a truncated marker. Failures are ignored; the marker is only an
+    optimization.
+
+    Args:
+        config_path: Path to config.yaml file.
+        summary: Summary lines describing the validated configuration.
+
+    Returns:
+        None: The marker is written if possible.
+    """
+    try:
+        st = os.stat(config_path)
+        _write_atomic(
+            _validation_marker_path(config_path),
+            json.dumps(
+                {"mtime": st.st_mtime_ns, "size": st.st_size, "summary": summary}
+            ),
+        )
+    except OSError:
+        pass
 
 
 def validate_config(
-    config_path: Path | None = None, env_path: Path | None = None
-) -> tuple[bool, str]:
+    config_path: Path | None = None,
+    env_path: Path | None = None,
+    use_cache: bool = True,
+    force: bool = False,
+) -> tuple[bool, str, ConfigView | None]:
     """Validate configuration file and environment variables.
 
+    If config.yaml has not changed since it last passed validation, it is not
+    parsed again and the summary recorded at that time is reused. The .env
+    file and API key are always checked.
+
     Args:
         config_path: Path to config.yaml file. If None, uses config.yaml in current directory.
         env_path: Path to .env file. If None, uses .env in current directory.
+        use_cache: Whether a cached parse of config.yaml may be used.
+        force: Whether to fully validate config.yaml even if it is unchanged
+            since it last passed validation.
 
     Returns:
-        tuple[bool, str]: A tuple of (success, message) indicating validation result.
+        tuple[bool, str, ConfigView | None]: A tuple of (success, message, config)
+            indicating validation result. config is the loaded configuration
+            so callers can reuse it without parsing config.yaml again, or None
+            if it could not be loaded or was not parsed because it is unchanged.
     """
     messages: list[str] = []
+    config: ConfigView | None = None
 
     # Check config.yaml
     if config_path is None:
-        config_path = Path.cwd() / "config.yaml"
-
-    if not config_path.exists():
-        return False, f"Configuration file not found: {config_path}"
-
-    messages.append(f"Found config.yaml at: {config_path}")
+        config_path = DEFAULT_CONFIG_PATH
 
-    # Try to load and validate config
-    try:
-        config = load_config(config_path)
-        messages.append("Config file is valid YAML")
-        messages.append("All required fields are present")
-        messages.append(f"  - Source currencies: {', '.join(config['source'])}")
-        messages.append(f"  - Target currencies: {', '.join(config['currencies'])}")
-        messages.append(f"  - Output folder: {config['output_folder']}")
-        messages.append(f"  - Output format: {config['output_format']}")
-    except ConfigLoadError as e:
-        return False, f"Config load error:\n{str(e)}"
-    except ConfigValidationError as e:
-        return False, f"Config validation error:\n{str(e)}"
+    summary = None if force or not use_cache else _read_validation_marker(config_path)
+    if summary is not None:
+        messages.extend(summary)
+        messages.append("Configuration unchanged since last successful validation")
+    else:
+        # Try to load and validate config
+        try:
+            config = load_config(config_path, use_cache=use_cache)
+            summary = [
+                f"Found config.yaml at: {config_path.absolute()}",
+                "Config file is valid YAML",
+                "All required fields are present",
+                f"  - Source currencies: {', '.join(config['source'])}",
+                f"  - Target currencies: {', '.join(config['currencies'])}",
+                f"  - Output folder: {config['output_folder']}",
+                f"  - Output format: {config['output_format']}",
+            ]
+            messages.extend(summary)
+        except ConfigNotFoundError:
+            return (
+                False,
+                f"Configuration file not found: {config_path.absolute()}",
+                None,
+            )
+        except ConfigLoadError as e:
+            return False, f"Config load error:\n{str(e)}", None
+        except ConfigValidationError as e:
+            return False, f"Config validation error:\n{str(e)}", None
 
     # Check .env file
     if env_path is None:
-        env_path = Path.cwd() / ".env"
+        env_path = DEFAULT_ENV_PATH
 
     if not env_path.exists():
-        messages.append(f"\nWarning: .env file not found at: {env_path}")
+        messages.append(f"\nWarning: .env file not found at: {env_path.absolute()}")
     else:
-        messages.append(f"\nFound .env file at: {env_path}")
+        messages.append(f"\nFound .env file at: {env_path.absolute()}")
         load_env_file(env_path)
 
     # Check API key
@@ -204,6 +570,10 @@ def validate_config(
         masked_key = api_key[:4] + "..." + api_key[-4:] if len(api_key) > 8 else "***"
         messages.append(f"CURRENCYLAYER_API_KEY is set: {masked_key}")
     except ConfigValidationError as e:
-        return False, "\n".join(messages) + f"\n\nError: {str(e)}"
+        return False, "\n".join(messages) + f"\n\nError: {str(e)}", config
+
+    # Only record a marker after a full check of config.yaml
+    if config is not None and summary is not None:
+        _write_validation_marker(config_path, summary)
 
-    return True, "\n".join(messages)
+    return True, "\n".join(messages), config
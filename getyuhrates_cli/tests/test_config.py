@@ -0,0 +1,247 @@
+"""Tests for loading and validating config.yaml.
+
+This module contains tests to verify how parsed configuration and successful
+validations are cached.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from getyuhratescli import config
+from getyuhratescli.config import load_config, validate_config
+
+CONFIG_YAML = """\
+source:
+  - USD
+currencies:
+  - EUR
+  - GBP
+always_download: N
+output_folder: ./reports/
+output_format: CSV
+send_emails: false
+sender_email: sender@mail.com
+recipients:
+  - user@mail.com
+subject_title: Rates
+email_body: Here are the rates
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_yaml_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own empty in-memory cache of parsed YAML.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace the module's cache.
+    """
+    monkeypatch.setattr(config, "_YAML_CACHE", OrderedDict())
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    """Write a valid config.yaml.
+
+    Args:
+        tmp_path (Path): Directory to write the file in.
+
+    Returns:
+        Path: Path to the config.yaml file.
+    """
+    path = tmp_path / "config.yaml"
+    _ = path.write_text(CONFIG_YAML, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def env_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Set an API key and get the path of a .env file that does not exist.
+
+    Args:
+        tmp_path (Path): Directory the .env file would be in.
+        monkeypatch (pytest.MonkeyPatch): Used to set the API key.
+
+    Returns:
+        Path: Path to the missing .env file.
+    """
+    monkeypatch.setenv("CURRENCYLAYER_API_KEY", "test-api-key")
+    return tmp_path / ".env"
+
+
+def sidecar_path(config_path: Path) -> Path:
+    """Get the path of the JSON sidecar written next to a config.yaml.
+
+    Args:
+        config_path (Path): Path to the config.yaml file.
+
+    Returns:
+        Path: Path to the sidecar.
+    """
+    return Path(f"{config_path}.cache.json")
+
+
+def fail_yaml_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make any attempt to parse YAML fail.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to replace yaml.load.
+    """
+
+    def load(*_args: object, **_kwargs: object) -> object:
+        raise AssertionError("config.yaml was parsed again")
+
+    monkeypatch.setattr(config.yaml, "load", load)
+
+
+def test_unchanged_file_is_served_from_cache(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an unchanged config.yaml is not parsed again.
+
+    This test verifies that repeated loads share one parse in memory, and
+    that a new process would read the sidecar instead of the YAML.
+    """
+    first = load_config(config_path)
+    fail_yaml_load(monkeypatch)
+
+    assert load_config(config_path) is first
+    assert sidecar_path(config_path).exists()
+
+    monkeypatch.setattr(config, "_YAML_CACHE", OrderedDict())
+    from_sidecar = load_config(config_path)
+
+    assert from_sidecar["source"] == ("USD",)
+    assert from_sidecar["currencies"] == ("EUR", "GBP")
+
+
+def test_changed_mtime_reparses_file(config_path: Path) -> None:
+    """Test that an edit which keeps the file size is still picked up.
+
+    This test verifies that both caches are invalidated by a new mtime.
+    """
+    _ = load_config(config_path)
+    st = config_path.stat()
+
+    _ = config_path.write_text(CONFIG_YAML.replace("USD", "GBP"), encoding="utf-8")
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert config_path.stat().st_size == st.st_size
+
+    assert load_config(config_path)["source"] == ("GBP",)
+
+    config._YAML_CACHE.clear()
+    assert load_config(config_path)["source"] == ("GBP",)
+
+
+def test_corrupt_sidecar_is_ignored(config_path: Path) -> None:
+    """Test that an unreadable sidecar falls back to parsing the YAML.
+
+    This test verifies that the sidecar is rewritten with the new parse.
+    """
+    _ = sidecar_path(config_path).write_text('{"_yaml_mtime_ns": ', encoding="utf-8")
+
+    loaded = load_config(config_path)
+
+    assert loaded["source"] == ("USD",)
+    sidecar = json.loads(sidecar_path(config_path).read_text(encoding="utf-8"))
+    assert sidecar["data"]["source"] == ["USD"]
+
+
+def test_mutable_config_is_independent(config_path: Path) -> None:
+    """Test that mutable=True returns a private, modifiable copy.
+
+    This test verifies that changing the copy does not affect the cached
+    configuration or later copies.
+    """
+    first = load_config(config_path, mutable=True)
+    first["source"].append("GBP")
+    first["output_format"] = "PDF"
+
+    second = load_config(config_path, mutable=True)
+
+    assert isinstance(second, dict)
+    assert second["source"] == ["USD"]
+    assert second["output_format"] == "CSV"
+    assert load_config(config_path)["source"] == ("USD",)
+
+
+def test_use_cache_false_skips_sidecar(config_path: Path) -> None:
+    """Test that use_cache=False parses config.yaml even with a current sidecar.
+
+    This test verifies that stale data in a sidecar whose validator still
+    matches the file is replaced by the parsed YAML.
+    """
+    st = config_path.stat()
+    stale = {"source": ["XXX"], "currencies": ["EUR"]}
+    _ = sidecar_path(config_path).write_text(
+        json.dumps(
+            {"_yaml_mtime_ns": st.st_mtime_ns, "_yaml_size": st.st_size, "data": stale}
+        ),
+        encoding="utf-8",
+    )
+
+    assert load_config(config_path, use_cache=False)["source"] == ("USD",)
+
+    config._YAML_CACHE.clear()
+    assert load_config(config_path)["source"] == ("USD",)
+
+
+UNCHANGED_MESSAGE = "Configuration unchanged since last successful validation"
+
+
+def test_validation_marker_is_reused(config_path: Path, env_path: Path) -> None:
+    """Test that an unchanged config.yaml is not validated again.
+
+    This test verifies that the summary recorded by the first validation is
+    reported without loading the configuration.
+    """
+    success, message, loaded = validate_config(config_path, env_path)
+    assert success is True
+    assert loaded is not None
+    assert UNCHANGED_MESSAGE not in message
+    assert Path(f"{config_path}.validated").exists()
+
+    success, reused_message, loaded = validate_config(config_path, env_path)
+
+    assert success is True
+    assert loaded is None
+    assert UNCHANGED_MESSAGE in reused_message
+    assert "  - Source currencies: USD" in reused_message
+
+
+def test_validation_marker_is_invalidated_on_edit(
+    config_path: Path, env_path: Path
+) -> None:
+    """Test that an edited config.yaml is validated again.
+
+    This test verifies that an invalid edit is reported even though the
+    previous version passed validation.
+    """
+    _ = validate_config(config_path, env_path)
+
+    _ = config_path.write_text(
+        CONFIG_YAML.replace("source:\n  - USD\n", ""), encoding="utf-8"
+    )
+    success, message, loaded = validate_config(config_path, env_path)
+
+    assert success is False
+    assert loaded is None
+    assert "Missing required fields in config.yaml: source" in message
+
+
+def test_force_ignores_validation_marker(config_path: Path, env_path: Path) -> None:
+    """Test that force=True validates config.yaml even if it is unchanged.
+
+    This test verifies that the configuration is loaded and returned.
+    """
+    _ = validate_config(config_path, env_path)
+
+    success, message, loaded = validate_config(config_path, env_path, force=True)
+
+    assert success is True
+    assert loaded is not None
+    assert loaded["source"] == ("USD",)
+    assert UNCHANGED_MESSAGE not in message
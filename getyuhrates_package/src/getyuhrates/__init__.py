@@ -6,20 +6,22 @@ flexible output formats.
 
 Main exports:
     GetYuhRates: Main client class for API interactions
-    CurrencyResult: TypedDict for result data structure
+    CurrencyResult: Dataclass for result data structure
     AbstractWriter: Base class for implementing custom writers
     CSVWriter: CSV file writer implementation
+    ParquetWriter: Parquet file writer implementation (requires pyarrow)
 
 Example:
     >>> from getyuhrates import GetYuhRates
     >>> client = GetYuhRates()
     >>> results = client.get_rates(source=["USD"], currencies=["EUR", "GBP"])
-    >>> print(results[0]["rates"])
+    >>> print(results[0].rates)
 """
 
 from getyuhrates.csv_writer import CSVWriter
 from getyuhrates.currencyresult import CurrencyResult
 from getyuhrates.getyuhrates import GetYuhRates
+from getyuhrates.parquet_writer import ParquetWriter
 from getyuhrates.writer import AbstractWriter
 
 __all__ = [
@@ -27,6 +29,7 @@ __all__ = [
     "CurrencyResult",
     "AbstractWriter",
     "CSVWriter",
+    "ParquetWriter",
 ]
 
 __version__ = "0.1.0"
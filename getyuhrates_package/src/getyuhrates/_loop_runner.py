@@ -0,0 +1,50 @@
+"""Background event loop for the synchronous API.
+
+This module runs a single event loop on a daemon thread and lets synchronous
+methods such as GetYuhRates.get_rates submit coroutines to it, instead of
+creating and tearing down a new loop with asyncio.run on every call.
+"""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock: threading.Lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting it on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Event loop running on the background thread.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="getyuhrates-loop", daemon=True
+            )
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background event loop and wait for its result.
+
+    Unlike asyncio.run, this may also be called from a thread that already has
+    a running event loop, although that loop is blocked until the call returns.
+
+    Args:
+        coro (Coroutine[Any, Any, T]): Coroutine to run.
+
+    Returns:
+        T: The value returned by the coroutine.
+
+    Raises:
+        Exception: Any exception raised by the coroutine.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
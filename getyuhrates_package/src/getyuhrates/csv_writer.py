@@ -4,14 +4,141 @@ This module provides a CSV writer that implements the AbstractWriter interface
 to export currency exchange rate data to CSV files.
 """
 
+import asyncio
 import csv
 import os
+import time
+from collections.abc import AsyncIterable
 from datetime import datetime
-from pathlib import Path
-from typing import override
+from typing import TextIO, override
 
 from getyuhrates.currencyresult import CurrencyResult
-from getyuhrates.writer import AbstractWriter
+from getyuhrates.writer import AbstractWriter, resolve_file_path
+
+# Column order of the CSV output
+FIELDNAMES: tuple[str, ...] = (
+    "source",
+    "target",
+    "rate",
+    "pair",
+    "timestamp",
+    "success",
+    "reason",
+)
+
+# Buffer size used when writing CSV files (1 MiB)
+WRITE_BUFFER_SIZE: int = 1 << 20
+
+# A single CSV row, with values in FIELDNAMES order
+type Row = tuple[str, str, float, str, str, bool, str]
+
+
+def _append_rows(rows: list[Row], result: CurrencyResult, timestamp_str: str) -> None:
+    """Append the CSV rows for one result.
+
+    Args:
+        rows (list[Row]): List the rows are appended to.
+        result (CurrencyResult): Result to convert. A successful result gives
+            one row per currency pair, a failed one a single row with its reason.
+        timestamp_str (str): Timestamp written in every row.
+    """
+    source = result.source
+    success = result.success
+    reason = result.reason or ""
+
+    if success and result.rates:
+        # The pair format is SOURCETARGET, so the target currency is
+        # everything after the source prefix (e.g., "USDEUR" -> "EUR")
+        src_len = len(source)
+        # Add a row for each currency pair; only target, rate and pair vary
+        rows.extend(
+            (source, pair[src_len:], rate, pair, timestamp_str, success, reason)
+            for pair, rate in result.rates.items()
+        )
+    else:
+        # Add a single row indicating failure
+        rows.append((source, "", 0.0, "", timestamp_str, success, reason))
+
+
+def _format_rows(rows: list[Row], fieldnames: tuple[str, ...]) -> str | None:
+    """Format a header and rows as CSV text without going through the csv module.
+
+    Fields are joined with commas as-is, which matches csv.writer's output as
+    long as no field needs quoting. Currency codes, rates and timestamps never
+    do, but an error reason might, so the result is checked afterwards.
+
+    Args:
+        rows (list[Row]): Rows to format after the header.
+        fieldnames (tuple[str, ...]): Column names for the header row.
+
+    Returns:
+        str | None: The CSV text, or None if a field contains a comma, quote
+            or line break and must be written with csv.writer instead.
+    """
+    lines = [",".join(fieldnames)]
+    lines.extend(
+        f"{source},{target},{rate!r},{pair},{timestamp},{success},{reason}"
+        for source, target, rate, pair, timestamp, success, reason in rows
+    )
+    text = "\r\n".join(lines) + "\r\n"
+
+    # Any special character inside a field shows up as an extra separator,
+    # quote or line break compared to what the joins themselves produced
+    line_count = len(lines)
+    if (
+        '"' in text
+        or text.count(",") != (len(fieldnames) - 1) * line_count
+        or text.count("\n") != line_count
+        or text.count("\r") != line_count
+    ):
+        return None
+    return text
+
+
+def _sync_to_disk(csvfile: TextIO) -> None:
+    """Flush a file and wait until the OS has written it to disk.
+
+    Args:
+        csvfile (TextIO): Open file to flush and sync.
+    """
+    csvfile.flush()
+    os.fsync(csvfile.fileno())
+
+
+def _write_rows_sync(
+    file_path: str,
+    rows: list[Row],
+    fieldnames: tuple[str, ...],
+    fsync: bool = False,
+) -> None:
+    """Write a header and rows to a CSV file, blocking until done.
+
+    The whole file is written with a single write call when no field needs
+    quoting, falling back to csv.writer otherwise.
+
+    Args:
+        file_path (str): Path of the CSV file to create or overwrite.
+        rows (list[Row]): Rows to write after the header.
+        fieldnames (tuple[str, ...]): Column names for the header row.
+        fsync (bool): Whether to wait for the file to reach the disk before
+            returning, rather than leaving it in the OS page cache.
+    """
+    text = _format_rows(rows, fieldnames)
+
+    # Write through a large buffer so big rate dumps need few writes
+    with open(
+        file_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+    ) as csvfile:
+        if text is not None:
+            _ = csvfile.write(text)
+        else:
+            writer = csv.writer(csvfile)
+            # writerow returns a value we don't need, intentionally ignoring it
+            _ = writer.writerow(fieldnames)
+            writer.writerows(rows)
+
+        if fsync:
+            _sync_to_disk(csvfile)
 
 
 class CSVWriter(AbstractWriter):
@@ -32,14 +159,12 @@ class CSVWriter(AbstractWriter):
     Example:
         >>> writer = CSVWriter()
         >>> results = [
-        ...     {
-        ...         "success": True,
-        ...         "source": "USD",
-        ...         "currencies": ["EUR", "GBP"],
-        ...         "rates": {"USDEUR": 0.85, "USDGBP": 0.74},
-        ...         "reason": None,
-        ...         "file_location": None
-        ...     }
+        ...     CurrencyResult(
+        ...         success=True,
+        ...         source="USD",
+        ...         currencies=["EUR", "GBP"],
+        ...         rates={"USDEUR": 0.85, "USDGBP": 0.74},
+        ...     )
         ... ]
         >>> filepath = await writer.async_write_to_file(
         ...     data=results,
@@ -48,6 +173,18 @@ class CSVWriter(AbstractWriter):
         ... )
     """
 
+    def __init__(self, fsync: bool = False) -> None:
+        """Initialize the CSV writer.
+
+        Args:
+            fsync (bool): Whether to wait for each file to reach the disk
+                before returning. By default files are left in the OS page
+                cache to be written out later, which is faster but means a
+                crash or power loss shortly after writing can lose the file.
+                Default is False.
+        """
+        self.fsync: bool = fsync
+
     @override
     async def async_write_to_file(
         self,
@@ -78,7 +215,7 @@ class CSVWriter(AbstractWriter):
 
         Example:
             >>> writer = CSVWriter()
-            >>> results = [{"success": True, "source": "USD", ...}]
+            >>> results = [CurrencyResult(success=True, source="USD", ...)]
             >>> filepath = await writer.async_write_to_file(
             ...     data=results,
             ...     output_folder=Path("/tmp/output"),
@@ -87,83 +224,84 @@ class CSVWriter(AbstractWriter):
             >>> print(filepath)
             /tmp/output/rates.csv
         """
-        # Convert to Path for easier handling
-        output_path = Path(output_folder)
+        now = time.time()
+        file_path = resolve_file_path(output_folder, filename, now, ".csv")
+
+        # Prepare rows for CSV, as tuples in FIELDNAMES order
+        rows: list[Row] = []
+        timestamp_str = datetime.fromtimestamp(now).isoformat()
+        for result in data:
+            _append_rows(rows, result, timestamp_str)
 
-        # Create output directory if it doesn't exist
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Write on a worker thread so other tasks on the event loop keep running
+        await asyncio.to_thread(
+            _write_rows_sync, file_path, rows, FIELDNAMES, self.fsync
+        )
 
-        # Generate filename if not provided
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"currency_rates_{timestamp}.csv"
+        return file_path
 
-        # Ensure .csv extension
-        if not filename.endswith(".csv"):
-            filename = f"{filename}.csv"
+    async def async_write_stream(
+        self,
+        results: AsyncIterable[CurrencyResult],
+        output_folder: os.PathLike[str],
+        filename: str | None,
+    ) -> str:
+        """Write currency results to a CSV file as they arrive.
 
-        # Full file path
-        file_path = output_path / filename
+        Unlike async_write_to_file, the results do not need to be collected
+        first: the file is opened once, each result's rows are written as soon
+        as it is received, and only one result's rows are held in memory at a
+        time. The output has the same format as async_write_to_file.
 
-        # Prepare rows for CSV
-        rows: list[dict[str, str | float | bool]] = []
-        timestamp_str = datetime.now().isoformat()
+        Args:
+            results (AsyncIterable[CurrencyResult]): Results to write, in the
+                order they should appear in the file.
+            output_folder (os.PathLike[str]): Directory path where the CSV file
+                should be written. The directory will be created if it doesn't exist.
+            filename (str | None): Name for the CSV file. If None, generates a
+                timestamped filename in the format "currency_rates_YYYYMMDD_HHMMSS.csv".
 
-        for result in data:
-            source = result["source"]
-            success = result["success"]
-            reason = result.get("reason") or ""
-
-            if success and result["rates"]:
-                # Add a row for each currency pair
-                for pair, rate in result["rates"].items():
-                    # Extract target currency from pair (e.g., "USDEUR" -> "EUR")
-                    # The pair format is SOURCETARGET, so we remove the source prefix
-                    target = pair[len(source) :]
-
-                    rows.append(
-                        {
-                            "source": source,
-                            "target": target,
-                            "rate": rate,
-                            "pair": pair,
-                            "timestamp": timestamp_str,
-                            "success": success,
-                            "reason": reason,
-                        }
-                    )
-            else:
-                # Add a single row indicating failure
-                rows.append(
-                    {
-                        "source": source,
-                        "target": "",
-                        "rate": 0.0,
-                        "pair": "",
-                        "timestamp": timestamp_str,
-                        "success": success,
-                        "reason": reason,
-                    }
-                )
-
-        # Write CSV file
-        with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-            if rows:
-                fieldnames = [
-                    "source",
-                    "target",
-                    "rate",
-                    "pair",
-                    "timestamp",
-                    "success",
-                    "reason",
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                # writeheader returns a value we don't need, intentionally ignoring it
-                writer.writeheader()
+        Returns:
+            str: Absolute path to the created CSV file.
+
+        Raises:
+            OSError: If there are issues creating the directory or writing the file.
+
+        Example:
+            >>> writer = CSVWriter()
+            >>> async def fetch_results():
+            ...     yield CurrencyResult(success=True, source="USD", ...)
+            >>> filepath = await writer.async_write_stream(
+            ...     results=fetch_results(),
+            ...     output_folder=Path("/tmp/output"),
+            ...     filename="rates.csv"
+            ... )
+        """
+        now = time.time()
+        file_path = resolve_file_path(output_folder, filename, now, ".csv")
+        timestamp_str = datetime.fromtimestamp(now).isoformat()
+
+        # Rows are small and go into the write buffer; only opening and the
+        # final flush on close touch the disk, so those run on a worker thread
+        csvfile = await asyncio.to_thread(
+            open,
+            file_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        )
+        try:
+            writer = csv.writer(csvfile)
+            # writerow returns a value we don't need, intentionally ignoring it
+            _ = writer.writerow(FIELDNAMES)
+            async for result in results:
+                rows: list[Row] = []
+                _append_rows(rows, result, timestamp_str)
                 writer.writerows(rows)
-            else:
-                # Write header only if no data
-                _ = csvfile.write("source,target,rate,pair,timestamp,success,reason\n")
+            if self.fsync:
+                await asyncio.to_thread(_sync_to_disk, csvfile)
+        finally:
+            await asyncio.to_thread(csvfile.close)
 
-        return str(file_path.absolute())
+        return file_path
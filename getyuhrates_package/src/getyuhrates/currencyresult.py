@@ -1,18 +1,21 @@
 """Currency result type definition.
 
-This module defines the CurrencyResult TypedDict structure used throughout
-the getyuhrates package to represent the results of currency exchange rate queries.
+This module defines the CurrencyResult dataclass used throughout the
+getyuhrates package to represent the results of currency exchange rate queries.
 """
 
-from typing import TypedDict
+from dataclasses import dataclass
 
 
-class CurrencyResult(TypedDict):
+@dataclass(slots=True, frozen=True)
+class CurrencyResult:
     """Result structure for currency exchange rate operations.
 
-    This TypedDict defines the standard format for returning currency exchange
+    This dataclass defines the standard format for returning currency exchange
     rate data from the CurrencyLayer API, including success status, rates, and
-    optional file location if results were written to disk.
+    optional file location if results were written to disk. It uses slots, so
+    field access is an attribute load rather than a dict lookup and each result
+    takes less memory than an equivalent dict.
 
     Attributes:
         success (bool): Whether the API request succeeded.
@@ -26,23 +29,24 @@ class CurrencyResult(TypedDict):
             were written to disk, None otherwise.
 
     Example:
-        >>> result: CurrencyResult = {
-        ...     "success": True,
-        ...     "source": "USD",
-        ...     "currencies": ["EUR", "GBP", "CAD"],
-        ...     "rates": {
+        >>> result = CurrencyResult(
+        ...     success=True,
+        ...     source="USD",
+        ...     currencies=["EUR", "GBP", "CAD"],
+        ...     rates={
         ...         "USDEUR": 0.852504,
         ...         "USDGBP": 0.742556,
         ...         "USDCAD": 1.37365
         ...     },
-        ...     "reason": None,
-        ...     "file_location": "/path/to/output/rates.csv"
-        ... }
+        ...     file_location="/path/to/output/rates.csv"
+        ... )
+        >>> result.rates["USDEUR"]
+        0.852504
     """
 
     success: bool
     source: str
     currencies: list[str]
     rates: dict[str, float]
-    reason: str | None
-    file_location: str | None
+    reason: str | None = None
+    file_location: str | None = None
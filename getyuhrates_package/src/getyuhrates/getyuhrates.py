@@ -7,39 +7,107 @@ results to various file formats.
 """
 
 import asyncio
+import dataclasses
 import os
+from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any, cast
 
 import aiohttp
-import requests
 from dotenv import load_dotenv
 
+# orjson parses API responses several times faster than the standard library;
+# fall back to json when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from getyuhrates._loop_runner import run as run_on_loop
 from getyuhrates.csv_writer import CSVWriter
 from getyuhrates.currencyresult import CurrencyResult
+from getyuhrates.ratelimiter import RateLimiter
 from getyuhrates.writer import AbstractWriter
 
 # Load environment variables from .env file
 _ = load_dotenv()
 
+# Number of decimal places the CurrencyLayer API reports rates with
+RATE_PRECISION: int = 6
+
+# CurrencyLayer error codes for an invalid source (201) or target (202)
+# currency; every other error applies to the account or the whole request
+_CURRENCY_ERROR_CODES: frozenset[int] = frozenset({201, 202})
+
+
+def _self_result(src: str, currencies: list[str]) -> CurrencyResult:
+    """Build the result of converting a currency to itself.
+
+    Every call returns a new result, so callers are free to modify its rates
+    and currencies.
+
+    Args:
+        src (str): Currency code used as both source and target.
+        currencies (list[str]): Target currencies that were requested.
+
+    Returns:
+        CurrencyResult: Successful result with a rate of 1.0.
+    """
+    return CurrencyResult(
+        success=True,
+        source=src,
+        currencies=currencies,
+        rates={f"{src}{src}": 1.0},
+    )
+
+
+def _failed_results(
+    sources: list[str], currencies: list[str], reason: str
+) -> list[CurrencyResult]:
+    """Build a failed result for each source currency.
+
+    Args:
+        sources (list[str]): Source currency codes that were requested.
+        currencies (list[str]): Target currencies that were requested.
+        reason (str): Error message recorded in every result.
+
+    Returns:
+        list[CurrencyResult]: One failed result per source currency.
+    """
+    return [
+        CurrencyResult(
+            success=False, source=src, currencies=currencies, rates={}, reason=reason
+        )
+        for src in sources
+    ]
+
 
 class GetYuhRates:
     """Client for retrieving currency exchange rates from CurrencyLayer API.
 
     This class provides methods to fetch live currency exchange rates from the
-    CurrencyLayer API. It supports multiple source currencies, automatic request
-    splitting (since the API only supports one source per request), and optional
-    file output in various formats.
+    CurrencyLayer API. It supports multiple source currencies and optional file
+    output in various formats. Since the API only supports one source per
+    request, rates for multiple sources are derived from a single request
+    against an anchor currency (USD), falling back to one request per source
+    if the anchor request does not cover every currency.
 
     The API key is retrieved from the CURRENCYLAYER_API_KEY environment variable.
 
     To prevent API rate-limiting errors when using multiple source currencies,
-    this client introduces a configurable delay between requests. This can be
-    controlled via the `GETYUHRATES_REQUEST_DELAY_SECONDS` environment
-    variable (defaults to 0.5 seconds).
+    requests are paced by a token bucket. The sustained rate is one request per
+    `GETYUHRATES_REQUEST_DELAY_SECONDS` (defaults to 1 second), and up to
+    `GETYUHRATES_REQUEST_BURST` requests (defaults to 1) may be sent back to
+    back after the client has been idle.
 
     Attributes:
         api_key (str): CurrencyLayer API key from environment.
         base_url (str): Base URL for the CurrencyLayer API.
+        anchor_currency (str): Currency used as the common base when deriving
+            rates for multiple sources from a single request.
+        rate_limiter (RateLimiter): Limiter shared by all requests from this client.
+        session (aiohttp.ClientSession | None): Caller-owned HTTP session reused
+            for every request, or None to open a session per request.
 
     Example:
         >>> client = GetYuhRates()
@@ -48,15 +116,25 @@ class GetYuhRates:
         ...     currencies=["EUR", "CAD"]
         ... )
         >>> for result in results:
-        ...     if result["success"]:
-        ...         print(f"{result['source']}: {result['rates']}")
+        ...     if result.success:
+        ...         print(f"{result.source}: {result.rates}")
     """
 
-    def __init__(self) -> None:
+    anchor_currency: str = "USD"
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
         """Initialize the GetYuhRates client.
 
         Loads the API key from the CURRENCYLAYER_API_KEY environment variable.
 
+        Args:
+            session (aiohttp.ClientSession | None): Optional HTTP session to
+                reuse for every request, keeping connections to the API alive
+                between calls. The caller owns the session and is responsible
+                for closing it. It must belong to the event loop the client's
+                async methods run on, so it is only useful with
+                get_rates_async. Default is None.
+
         Raises:
             ValueError: If the CURRENCYLAYER_API_KEY environment variable is not set.
         """
@@ -66,6 +144,20 @@ class GetYuhRates:
                 "CURRENCYLAYER_API_KEY environment variable is not set. Please set it with your CurrencyLayer API key."
             )
         self.base_url: str = "https://apilayer.net/api/live"
+        self.session: aiohttp.ClientSession | None = session
+
+        # Get request pacing from environment variables
+        try:
+            delay_seconds = float(
+                os.getenv("GETYUHRATES_REQUEST_DELAY_SECONDS", "1") or "1"
+            )
+        except (ValueError, TypeError):
+            delay_seconds = 1
+        try:
+            burst = int(os.getenv("GETYUHRATES_REQUEST_BURST", "1") or "1")
+        except (ValueError, TypeError):
+            burst = 1
+        self.rate_limiter: RateLimiter = RateLimiter(delay_seconds, burst)
 
     async def get_rates_async(
         self,
@@ -76,17 +168,22 @@ class GetYuhRates:
     ) -> list[CurrencyResult]:
         """Retrieve currency exchange rates asynchronously.
 
-        Fetches live currency exchange rates from the CurrencyLayer API. To
-        avoid rate-limiting issues, requests for multiple source currencies are
-        made sequentially with a delay between them. This delay is configurable
-        via the `GETYUHRATES_REQUEST_DELAY_SECONDS` environment variable.
-
-        If a sources and target currency are identical (e.g., source=["USD"],
+        Fetches live currency exchange rates from the CurrencyLayer API.
+        When there are multiple source currencies, a single request is made
+        for the rates of every source and target against the anchor currency
+        (USD), and each source's rates are derived from those as cross rates.
+        If that request rejects a currency or does not return a rate for every
+        currency, one request per source is made instead; any other failure,
+        such as an invalid API key, is reported for every source without
+        further requests. Per-source requests run concurrently, so their network
+        latency overlaps, while the client's rate limiter paces when each
+        request is sent to avoid rate-limiting issues.
+
+        If a source is the only target currency (e.g., source=["USD"],
         currencies=["USD"]), it returns a rate of 1.0 without an API call.
 
         Args:
             sources (list[str]): List of source currency codes (e.g., ["USD", "GBP"]).
-                Each source will result in a separate API request.
             currencies (list[str]): List of target currency codes to get rates for
                 (e.g., ["EUR", "CAD", "JPY"]). Applied to all source currencies.
             output_path (str | os.PathLike[str] | None): Optional directory path
@@ -111,7 +208,7 @@ class GetYuhRates:
             ...     output_path="/tmp/output"
             ... )
             >>> for result in results:
-            ...     print(f"{result['source']}: {result['rates']}")
+            ...     print(f"{result.source}: {result.rates}")
         """
         if not sources:
             raise ValueError("Source currency list cannot be empty")
@@ -122,22 +219,25 @@ class GetYuhRates:
         if output_path and writer is None:
             writer = CSVWriter()
 
-        # Get request delay from environment variable, default to 0.5 seconds
-        try:
-            delay_seconds = float(
-                os.getenv("GETYUHRATES_REQUEST_DELAY_SECONDS", "1") or "1"
+        # Fetch all sources concurrently over one session so connections are
+        # reused; the rate limiter paces the requests
+        async with self._session_scope() as session:
+            anchored = (
+                await self._fetch_rates_via_anchor(session, sources, currencies)
+                if len(sources) > 1
+                else None
             )
-        except (ValueError, TypeError):
-            delay_seconds = 1
-
-        # Process sources sequentially with a delay to avoid rate-limiting
-        results: list[CurrencyResult] = []
-        for i, src in enumerate(sources):
-            result = await self._fetch_rates_async(src, currencies)
-            results.append(result)
-            # Do not sleep after the last request
-            if i < len(sources) - 1:
-                await asyncio.sleep(delay_seconds)
+            if anchored is not None:
+                results = anchored
+            else:
+                results = list(
+                    await asyncio.gather(
+                        *(
+                            self._fetch_rates_async(session, src, currencies)
+                            for src in sources
+                        )
+                    )
+                )
 
         # Write to file if output path is provided
         if output_path and writer:
@@ -146,14 +246,222 @@ class GetYuhRates:
                 output_folder=cast(os.PathLike[str], output_path),
                 filename=None,
             )
-            # Update all results with the file location
-            for result in results:
-                result["file_location"] = file_path
+            # Results are immutable, so attach the file location to copies
+            results = [
+                dataclasses.replace(result, file_location=file_path)
+                for result in results
+            ]
 
         return results
 
+    async def stream_rates_to_csv(
+        self,
+        sources: list[str],
+        currencies: list[str],
+        output_path: str | os.PathLike[str],
+        filename: str | None = None,
+        writer: CSVWriter | None = None,
+    ) -> tuple[str, list[CurrencyResult]]:
+        """Retrieve currency exchange rates and write them to CSV as they arrive.
+
+        Like get_rates_async with a CSVWriter, but each source's rows are
+        written to the file as soon as its request completes instead of after
+        all requests have finished, and successful results are not kept once
+        written. Rows therefore appear in completion order rather than in the
+        order of `sources`. Multiple sources are still fetched with a single
+        anchor currency request where possible. If writing fails, requests
+        that are still running are cancelled.
+
+        Args:
+            sources (list[str]): List of source currency codes (e.g., ["USD", "GBP"]).
+            currencies (list[str]): List of target currency codes to get rates for
+                (e.g., ["EUR", "CAD", "JPY"]). Applied to all source currencies.
+            output_path (str | os.PathLike[str]): Directory path to save results in.
+            filename (str | None): Name for the CSV file. If None, a timestamped
+                filename is generated.
+            writer (CSVWriter | None): Writer used to stream the results to the
+                file. Default is a new CSVWriter.
+
+        Returns:
+            tuple[str, list[CurrencyResult]]: Absolute path to the written CSV
+                file, and the results of sources whose request failed, each
+                with file_location set to that path.
+
+        Raises:
+            ValueError: If source or currencies lists are empty.
+            OSError: If there are issues creating the directory or writing the file.
+
+        Example:
+            >>> client = GetYuhRates()
+            >>> file_path, failures = await client.stream_rates_to_csv(
+            ...     sources=["USD", "GBP"],
+            ...     currencies=["EUR", "BBD"],
+            ...     output_path="/tmp/output"
+            ... )
+        """
+        if not sources:
+            raise ValueError("Source currency list cannot be empty")
+        if not currencies:
+            raise ValueError("Target currencies list cannot be empty")
+
+        if writer is None:
+            writer = CSVWriter()
+
+        failures: list[CurrencyResult] = []
+
+        async def fetch_all() -> AsyncGenerator[CurrencyResult, None]:
+            async with self._session_scope() as session:
+                anchored = (
+                    await self._fetch_rates_via_anchor(session, sources, currencies)
+                    if len(sources) > 1
+                    else None
+                )
+                if anchored is not None:
+                    for result in anchored:
+                        if not result.success:
+                            failures.append(result)
+                        yield result
+                    return
+
+                tasks = [
+                    asyncio.create_task(self._fetch_rates_async(session, src, currencies))
+                    for src in sources
+                ]
+                try:
+                    for next_result in asyncio.as_completed(tasks):
+                        result = await next_result
+                        if not result.success:
+                            failures.append(result)
+                        yield result
+                finally:
+                    # Stop requests the writer will never receive, and wait
+                    # for them before the session is closed
+                    for task in tasks:
+                        _ = task.cancel()
+                    _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = fetch_all()
+        try:
+            file_path = await writer.async_write_stream(
+                results=results,
+                output_folder=cast(os.PathLike[str], output_path),
+                filename=filename,
+            )
+        finally:
+            # Run the generator's cleanup now rather than when it is collected
+            await results.aclose()
+
+        return file_path, [
+            dataclasses.replace(result, file_location=file_path) for result in failures
+        ]
+
+    def _session_scope(
+        self,
+    ) -> AbstractAsyncContextManager[aiohttp.ClientSession]:
+        """Get a context manager providing the HTTP session for a batch of requests.
+
+        Uses the caller-provided session if there is one, leaving it open on
+        exit. Otherwise opens a new session with a pooled connector that is
+        closed when the context exits.
+
+        Returns:
+            AbstractAsyncContextManager[aiohttp.ClientSession]: Context manager
+                yielding the session to use.
+        """
+        if self.session is not None:
+            return nullcontext(self.session)
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        )
+
+    async def _fetch_rates_via_anchor(
+        self, session: aiohttp.ClientSession, sources: list[str], currencies: list[str]
+    ) -> list[CurrencyResult] | None:
+        """Fetch rates for several source currencies with a single request.
+
+        Internal method that requests the rate of every source and target
+        currency against the anchor currency, then derives each source's
+        rates as cross rates: rate[SRC->TGT] = rate[USD->TGT] / rate[USD->SRC].
+        Derived rates are rounded to the precision the API reports rates with.
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session to send the request on.
+            sources (list[str]): List of source currency codes.
+            currencies (list[str]): List of target currency codes.
+
+        Returns:
+            list[CurrencyResult] | None: One result per source currency, or None
+                if the API rejected a currency or did not return a usable rate
+                for every currency, in which case the caller should fetch each
+                source separately to get per-source results and error messages.
+                Failures that would affect every request, such as an invalid
+                API key, throttling or a network error, give a failed result
+                for every source instead.
+        """
+        anchor = self.anchor_currency
+        # Every currency needed, in first-seen order, excluding the anchor itself
+        needed = [c for c in dict.fromkeys([*sources, *currencies]) if c != anchor]
+        if not needed:
+            return None
+
+        # Note: self.api_key is guaranteed to be str (not None) due to __init__ validation
+        params: dict[str, str | int] = {
+            "access_key": cast(str, self.api_key),
+            "source": anchor,
+            "currencies": ",".join(needed),
+            "format": 1,
+        }
+
+        await self.rate_limiter.wait_if_needed()
+
+        try:
+            async with session.get(self.base_url, params=params) as response:
+                if response.status == 429:
+                    self.rate_limiter.backoff()
+                    return _failed_results(
+                        sources, currencies, "Rate limit exceeded (HTTP 429)"
+                    )
+                # Using Any here is necessary because the API response structure is dynamic
+                data: dict[str, Any] = await response.json(loads=_json_loads)
+        except Exception as e:
+            return _failed_results(sources, currencies, f"Request failed: {str(e)}")
+
+        if not data.get("success"):
+            error_info: dict[str, Any] = cast(dict[str, Any], data.get("error", {}))
+            if error_info.get("code") in _CURRENCY_ERROR_CODES:
+                # Only some currencies are invalid; per-source requests
+                # report which ones while still returning the others
+                return None
+            return _failed_results(
+                sources, currencies, str(error_info.get("info", "Unknown error"))
+            )
+        self.rate_limiter.recover()
+
+        quotes: dict[str, float] = cast(dict[str, float], data.get("quotes", {}))
+        anchor_rates: dict[str, float] = {anchor: 1.0}
+        for code in needed:
+            rate = quotes.get(f"{anchor}{code}")
+            if not rate:
+                return None
+            anchor_rates[code] = rate
+
+        return [
+            CurrencyResult(
+                success=True,
+                source=src,
+                currencies=currencies,
+                rates={
+                    f"{src}{target}": round(
+                        anchor_rates[target] / anchor_rates[src], RATE_PRECISION
+                    )
+                    for target in currencies
+                },
+            )
+            for src in sources
+        ]
+
     async def _fetch_rates_async(
-        self, src: str, currencies: list[str]
+        self, session: aiohttp.ClientSession, src: str, currencies: list[str]
     ) -> CurrencyResult:
         """Fetch rates for a single source currency asynchronously.
 
@@ -162,6 +470,7 @@ class GetYuhRates:
         1.0 without making an API call.
 
         Args:
+            session (aiohttp.ClientSession): HTTP session to send the request on.
             src (str): Source currency code.
             currencies (list[str]): List of target currency codes.
 
@@ -169,68 +478,79 @@ class GetYuhRates:
             CurrencyResult: Result containing rates and status information.
         """
         # Check if source equals all currencies (skip API call)
-        if len(currencies) == 1 and src == currencies[0]:
-            return {
-                "success": True,
-                "source": src,
-                "currencies": currencies,
-                "rates": {f"{src}{src}": 1.0},
-                "reason": None,
-                "file_location": None,
-            }
+        if set(currencies) == {src}:
+            return _self_result(src, currencies)
+
+        # The rate from the source to itself is always 1.0, so don't ask the
+        # API for it; it is added back to the rates once the response arrives
+        includes_src = src in currencies
+        query_currencies = (
+            [c for c in currencies if c != src] if includes_src else currencies
+        )
 
         # Build API request parameters
         # Note: self.api_key is guaranteed to be str (not None) due to __init__ validation
         params: dict[str, str | int] = {
             "access_key": cast(str, self.api_key),
             "source": src,
-            "currencies": ",".join(currencies),
+            "currencies": ",".join(query_currencies),
             "format": 1,
         }
 
+        await self.rate_limiter.wait_if_needed()
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    # Using Any here is necessary because the API response structure is dynamic
-                    # and cannot be fully typed without creating complex type definitions
-                    data: dict[str, Any] = await response.json()
-
-                    if data.get("success"):
-                        # Cast to the expected type after validation
-                        quotes: dict[str, float] = cast(
-                            dict[str, float], data.get("quotes", {})
-                        )
-                        return {
-                            "success": True,
-                            "source": src,
-                            "currencies": currencies,
-                            "rates": quotes,
-                            "reason": None,
-                            "file_location": None,
-                        }
-                    else:
-                        # Extract error information with proper casting
-                        error_info: dict[str, Any] = cast(
-                            dict[str, Any], data.get("error", {})
-                        )
-                        error_msg: str = str(error_info.get("info", "Unknown error"))
-                        return {
-                            "success": False,
-                            "source": src,
-                            "currencies": currencies,
-                            "rates": {},
-                            "reason": error_msg,
-                            "file_location": None,
-                        }
+            async with session.get(self.base_url, params=params) as response:
+                if response.status == 429:
+                    # Throttled: slow down subsequent requests
+                    self.rate_limiter.backoff()
+                    return CurrencyResult(
+                        success=False,
+                        source=src,
+                        currencies=currencies,
+                        rates={},
+                        reason="Rate limit exceeded (HTTP 429)",
+                    )
+
+                # Using Any here is necessary because the API response structure is dynamic
+                # and cannot be fully typed without creating complex type definitions
+                data: dict[str, Any] = await response.json(loads=_json_loads)
+
+                if data.get("success"):
+                    self.rate_limiter.recover()
+                    # Cast to the expected type after validation
+                    quotes: dict[str, float] = cast(
+                        dict[str, float], data.get("quotes", {})
+                    )
+                    if includes_src:
+                        quotes[f"{src}{src}"] = 1.0
+                    return CurrencyResult(
+                        success=True,
+                        source=src,
+                        currencies=currencies,
+                        rates=quotes,
+                    )
+                else:
+                    # Extract error information with proper casting
+                    error_info: dict[str, Any] = cast(
+                        dict[str, Any], data.get("error", {})
+                    )
+                    error_msg: str = str(error_info.get("info", "Unknown error"))
+                    return CurrencyResult(
+                        success=False,
+                        source=src,
+                        currencies=currencies,
+                        rates={},
+                        reason=error_msg,
+                    )
         except Exception as e:
-            return {
-                "success": False,
-                "source": src,
-                "currencies": currencies,
-                "rates": {},
-                "reason": f"Request failed: {str(e)}",
-                "file_location": None,
-            }
+            return CurrencyResult(
+                success=False,
+                source=src,
+                currencies=currencies,
+                rates={},
+                reason=f"Request failed: {str(e)}",
+            )
 
     def get_rates(
         self,
@@ -243,7 +563,9 @@ class GetYuhRates:
 
         Fetches live currency exchange rates from the CurrencyLayer API for
         multiple sources currencies. This is a synchronous wrapper around
-        get_rates_async that runs the async method in an event loop.
+        get_rates_async that runs the async method on a background event loop
+        shared by all synchronous calls, so repeated calls do not each pay for
+        creating and closing a loop.
 
         Args:
             sources (list[str]): List of source currency codes (e.g., ["USD", "GBP"]).
@@ -258,7 +580,7 @@ class GetYuhRates:
 
         Raises:
             ValueError: If sources or currencies lists are empty.
-            requests.RequestException: If there are network issues with the API request.
+            aiohttp.ClientError: If there are network issues with the API request.
 
         Example:
             >>> client = GetYuhRates()
@@ -267,87 +589,9 @@ class GetYuhRates:
             ...     currencies=["EUR", "GBP", "CAD"],
             ...     output_path="./output"
             ... )
-            >>> print(results[0]["rates"])
+            >>> print(results[0].rates)
             {'USDEUR': 0.85, 'USDGBP': 0.74, 'USDCAD': 1.37}
         """
-        return asyncio.run(
+        return run_on_loop(
             self.get_rates_async(sources, currencies, output_path, writer)
         )
-
-    def _fetch_rates_sync(self, src: str, currencies: list[str]) -> CurrencyResult:
-        """Fetch rates for a single source currency synchronously.
-
-        Internal method that handles API requests for a single source currency
-        using the requests library. If the source currency equals all target
-        currencies, returns a rate of 1.0 without making an API call.
-
-        This method is kept for potential future use but currently the package
-        uses the async method with asyncio.run() for the synchronous interface.
-
-        Args:
-            src (str): Source currency code.
-            currencies (list[str]): List of target currency codes.
-
-        Returns:
-            CurrencyResult: Result containing rates and status information.
-        """
-        # Check if source equals all currencies (skip API call)
-        if len(currencies) == 1 and src == currencies[0]:
-            return {
-                "success": True,
-                "source": src,
-                "currencies": currencies,
-                "rates": {f"{src}{src}": 1.0},
-                "reason": None,
-                "file_location": None,
-            }
-
-        # Build API request parameters
-        # Note: self.api_key is guaranteed to be str (not None) due to __init__ validation
-        params: dict[str, str | int] = {
-            "access_key": cast(str, self.api_key),
-            "source": src,
-            "currencies": ",".join(currencies),
-            "format": 1,
-        }
-
-        try:
-            response = requests.get(self.base_url, params=params, timeout=30)
-            # Using Any here is necessary because the API response structure is dynamic
-            # and cannot be fully typed without creating complex type definitions
-            data: dict[str, Any] = response.json()
-
-            if data.get("success"):
-                # Cast to the expected type after validation
-                quotes: dict[str, float] = cast(
-                    dict[str, float], data.get("quotes", {})
-                )
-                return {
-                    "success": True,
-                    "source": src,
-                    "currencies": currencies,
-                    "rates": quotes,
-                    "reason": None,
-                    "file_location": None,
-                }
-            else:
-                # Extract error information with proper casting
-                error_info: dict[str, Any] = cast(dict[str, Any], data.get("error", {}))
-                error_msg: str = str(error_info.get("info", "Unknown error"))
-                return {
-                    "success": False,
-                    "source": src,
-                    "currencies": currencies,
-                    "rates": {},
-                    "reason": error_msg,
-                    "file_location": None,
-                }
-        except Exception as e:
-            return {
-                "success": False,
-                "source": src,
-                "currencies": currencies,
-                "rates": {},
-                "reason": f"Request failed: {str(e)}",
-                "file_location": None,
-            }
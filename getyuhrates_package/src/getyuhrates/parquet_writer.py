@@ -0,0 +1,147 @@
+"""Parquet writer implementation.
+
+This module provides a Parquet writer that implements the AbstractWriter
+interface to export currency exchange rate data to compressed, columnar
+Parquet files. It requires the optional `pyarrow` dependency, installed with
+`pip install getyuhrates[parquet]`.
+"""
+
+import asyncio
+import importlib.util
+import os
+import time
+from datetime import datetime
+from typing import override
+
+from getyuhrates.currencyresult import CurrencyResult
+from getyuhrates.writer import AbstractWriter, resolve_file_path
+
+
+def _write_table_sync(file_path: str, data: list[CurrencyResult], now: float) -> None:
+    """Write currency results to a Parquet file, blocking until done.
+
+    Args:
+        file_path (str): Path of the Parquet file to create or overwrite.
+        data (list[CurrencyResult]): Results to write. A successful result
+            gives one row per currency pair, a failed one a single row with
+            its reason.
+        now (float): Time the file is being written, in seconds since the
+            epoch, stored in every row.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sources: list[str] = []
+    targets: list[str] = []
+    rates: list[float] = []
+    pairs: list[str] = []
+    successes: list[bool] = []
+    reasons: list[str] = []
+
+    for result in data:
+        source = result.source
+        success = result.success
+        reason = result.reason or ""
+
+        if success and result.rates:
+            src_len = len(source)
+            for pair, rate in result.rates.items():
+                sources.append(source)
+                targets.append(pair[src_len:])
+                rates.append(rate)
+                pairs.append(pair)
+                successes.append(success)
+                reasons.append(reason)
+        else:
+            # A single row indicating failure, as in CSVWriter
+            sources.append(source)
+            targets.append("")
+            rates.append(0.0)
+            pairs.append("")
+            successes.append(success)
+            reasons.append(reason)
+
+    timestamp = datetime.fromtimestamp(now)
+    table = pa.table(
+        {
+            "source": pa.array(sources, type=pa.string()),
+            "target": pa.array(targets, type=pa.string()),
+            "rate": pa.array(rates, type=pa.float64()),
+            "pair": pa.array(pairs, type=pa.string()),
+            "timestamp": pa.array([timestamp] * len(sources), type=pa.timestamp("us")),
+            "success": pa.array(successes, type=pa.bool_()),
+            "reason": pa.array(reasons, type=pa.string()),
+        }
+    )
+    pq.write_table(table, file_path, compression="zstd")
+
+
+class ParquetWriter(AbstractWriter):
+    """Parquet file writer for currency exchange rate data.
+
+    This writer exports the same columns as CSVWriter, but stores them typed
+    and zstd-compressed in a columnar file, so analytics tools can load single
+    columns without parsing text.
+
+    The Parquet file will have the following columns:
+    - source: Source currency code (e.g., "USD")
+    - target: Target currency code (e.g., "EUR")
+    - rate: Exchange rate as a double
+    - pair: Currency pair in format "SOURCETARGET" (e.g., "USDEUR")
+    - timestamp: Timestamp of when the data was written
+    - success: Boolean indicating if the API request succeeded
+    - reason: Error message if success is False, empty otherwise
+
+    Example:
+        >>> writer = ParquetWriter()
+        >>> filepath = await writer.async_write_to_file(
+        ...     data=results,
+        ...     output_folder=Path("/tmp"),
+        ...     filename="rates.parquet"
+        ... )
+    """
+
+    @override
+    async def async_write_to_file(
+        self,
+        data: list[CurrencyResult],
+        output_folder: os.PathLike[str],
+        filename: str | None,
+    ) -> str:
+        """Write currency data to a Parquet file asynchronously.
+
+        Builds one column per field from the results and writes them as a
+        single zstd-compressed Parquet file. Each row represents a single
+        currency pair conversion.
+
+        Args:
+            data (list[CurrencyResult]): List of currency results to write.
+                Each result contains exchange rate data for a single source currency.
+            output_folder (os.PathLike[str]): Directory path where the Parquet file
+                should be written. The directory will be created if it doesn't exist.
+            filename (str | None): Name for the Parquet file. If None, generates a
+                timestamped filename in the format
+                "currency_rates_YYYYMMDD_HHMMSS.parquet".
+
+        Returns:
+            str: Absolute path to the created Parquet file.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            OSError: If there are issues creating the directory or writing the file.
+        """
+        # Check for pyarrow up front; it is imported on the worker thread
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError(
+                "pyarrow is required for ParquetWriter. "
+                + "Install it with: pip install getyuhrates[parquet]"
+            )
+
+        now = time.time()
+        file_path = resolve_file_path(output_folder, filename, now, ".parquet")
+
+        # Build the table, compress and write on a worker thread so other
+        # tasks on the event loop keep running
+        await asyncio.to_thread(_write_table_sync, file_path, data, now)
+
+        return file_path
@@ -0,0 +1,130 @@
+"""Rate limiter for CurrencyLayer API requests.
+
+This module provides a token bucket rate limiter used by the GetYuhRates client
+to pace requests to the CurrencyLayer API.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket limiting how often API requests may be sent.
+
+    The bucket holds up to `burst` tokens and refills at one token every
+    `delay_seconds`. Each request consumes one token; when the bucket is empty
+    the caller waits until the next token becomes available. Tokens accumulate
+    while the client is idle, so a request following a quiet period is sent
+    immediately while the sustained rate stays capped at one request per
+    `delay_seconds`.
+
+    The interval adapts to the server using additive-increase/multiplicative-
+    decrease: `backoff` doubles it when the API reports throttling and
+    `recover` shrinks it by a small step after each successful request until
+    it is back at `delay_seconds`.
+
+    The limiter is safe to share between threads, e.g. when a single client
+    is used from several threads that each call the synchronous `get_rates`.
+
+    Attributes:
+        delay_seconds (float): Configured average interval between requests.
+        max_delay (float): Upper bound for the interval after backing off.
+        capacity (int): Maximum number of tokens the bucket can hold.
+        refill_rate (float): Tokens added to the bucket per second.
+        tokens (float): Tokens currently available. Negative while requests
+            are queued waiting for a refill.
+        last_refill (float): Monotonic timestamp of the last refill.
+
+    Example:
+        >>> limiter = RateLimiter(delay_seconds=1.0, burst=2)
+        >>> await limiter.wait_if_needed()
+    """
+
+    # Interval used when backing off from a limiter that starts disabled.
+    BACKOFF_FLOOR_SECONDS: float = 1.0
+    # Amount the interval shrinks by after each successful request.
+    RECOVERY_STEP_SECONDS: float = 0.1
+
+    def __init__(
+        self, delay_seconds: float, burst: int = 1, max_delay: float = 60.0
+    ) -> None:
+        """Initialize the rate limiter with a full bucket.
+
+        Args:
+            delay_seconds (float): Average interval between requests.
+                A value of 0 or less disables rate limiting until the API
+                reports throttling.
+            burst (int): Number of requests that may be sent back to back
+                after an idle period. Values below 1 are treated as 1.
+            max_delay (float): Upper bound for the interval after backing off.
+        """
+        self.delay_seconds: float = delay_seconds
+        self.max_delay: float = max_delay
+        self._dynamic_delay: float = max(delay_seconds, 0.0)
+        self.capacity: int = max(1, burst)
+        self.refill_rate: float = 1.0 / delay_seconds if delay_seconds > 0 else 0.0
+        self.tokens: float = float(self.capacity)
+        self.last_refill: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    async def wait_if_needed(self) -> None:
+        """Wait until a request may be sent, then consume a token.
+
+        The token is reserved before sleeping, so concurrent callers queue up
+        behind each other instead of all waking at the same time.
+
+        Returns:
+            None: Returns once the caller is allowed to send its request.
+        """
+        if self.refill_rate == 0.0:
+            return
+
+        # Only the token accounting is guarded; sleeping happens outside the
+        # lock so other callers can reserve their own slot in the meantime.
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.refill_rate,
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            wait_time = -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
+        if wait_time > 0:
+            if wait_time > 0.5:
+                logger.debug("Rate limit: waiting %.1fs before next request", wait_time)
+            await asyncio.sleep(wait_time)
+
+    def backoff(self) -> None:
+        """Double the interval between requests after the API throttled us.
+
+        Returns:
+            None: The refill rate is reduced, capped at max_delay.
+        """
+        with self._lock:
+            self._dynamic_delay = min(
+                self.max_delay,
+                max(self._dynamic_delay * 2, self.BACKOFF_FLOOR_SECONDS),
+            )
+            self.refill_rate = 1.0 / self._dynamic_delay
+
+    def recover(self) -> None:
+        """Shrink the interval between requests after a successful request.
+
+        Returns:
+            None: The refill rate is raised back towards delay_seconds.
+        """
+        with self._lock:
+            if self._dynamic_delay <= self.delay_seconds:
+                return
+            self._dynamic_delay = max(
+                self.delay_seconds, self._dynamic_delay - self.RECOVERY_STEP_SECONDS
+            )
+            self.refill_rate = (
+                1.0 / self._dynamic_delay if self._dynamic_delay > 0 else 0.0
+            )
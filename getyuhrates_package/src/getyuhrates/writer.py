@@ -6,11 +6,47 @@ into specific file formats (CSV, PDF, etc.).
 """
 
 import os
+import time
 from abc import ABC, abstractmethod
 
+from getyuhrates._loop_runner import run as run_on_loop
 from getyuhrates.currencyresult import CurrencyResult
 
 
+def resolve_file_path(
+    output_folder: os.PathLike[str], filename: str | None, now: float, extension: str
+) -> str:
+    """Get the absolute path of the file a writer creates, creating its directory.
+
+    Args:
+        output_folder (os.PathLike[str]): Directory the file is written to.
+            It will be created if it doesn't exist.
+        filename (str | None): Name for the file. If None, generates a
+            timestamped filename in the format
+            "currency_rates_YYYYMMDD_HHMMSS" followed by the extension.
+        now (float): Time the file is being written, in seconds since the
+            epoch, used for generated names.
+        extension (str): File extension including the dot (e.g., ".csv"),
+            added to the filename if it is missing.
+
+    Returns:
+        str: Absolute path of the file, with the given extension.
+    """
+    # Create output directory if it doesn't exist
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Generate filename if not provided
+    if filename is None:
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        filename = f"currency_rates_{timestamp}{extension}"
+
+    # Ensure the extension
+    if not filename.endswith(extension):
+        filename = f"{filename}{extension}"
+
+    return os.path.abspath(os.path.join(os.fspath(output_folder), filename))
+
+
 class AbstractWriter(ABC):
     """Abstract base class for writing currency data to files.
 
@@ -53,7 +89,7 @@ class AbstractWriter(ABC):
 
         Example:
             >>> writer = CSVWriter()
-            >>> results = [{"success": True, "source": "USD", ...}]
+            >>> results = [CurrencyResult(success=True, source="USD", ...)]
             >>> filepath = await writer.async_write_to_file(
             ...     data=results,
             ...     output_folder=Path("/tmp/output"),
@@ -73,8 +109,8 @@ class AbstractWriter(ABC):
         """Write currency data to a file synchronously.
 
         This is a synchronous wrapper around async_write_to_file. It runs the
-        async method in an event loop to provide a blocking interface for
-        synchronous code.
+        async method on the package's background event loop to provide a
+        blocking interface for synchronous code.
 
         Args:
             data (list[CurrencyResult]): List of currency results to write.
@@ -91,13 +127,13 @@ class AbstractWriter(ABC):
 
         Example:
             >>> writer = CSVWriter()
-            >>> results = [{"success": True, "source": "USD", ...}]
+            >>> results = [CurrencyResult(success=True, source="USD", ...)]
             >>> filepath = writer.write_to_file(
             ...     data=results,
             ...     output_folder=Path("/tmp/output"),
             ...     filename="rates.csv"
             ... )
         """
-        import asyncio
-
-        return asyncio.run(self.async_write_to_file(data, output_folder, filename))
+        return run_on_loop(
+            self.async_write_to_file(data, output_folder, filename)
+        )
@@ -0,0 +1,147 @@
+"""Tests for the CSVWriter.
+
+This module contains tests to verify the rows written to CSV files.
+"""
+
+import asyncio
+import csv
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from getyuhrates.csv_writer import FIELDNAMES, CSVWriter
+from getyuhrates.currencyresult import CurrencyResult
+
+
+def read_rows(path: str) -> list[list[str]]:
+    """Read a CSV file back into a list of rows.
+
+    Args:
+        path (str): Path to the CSV file.
+
+    Returns:
+        list[list[str]]: All rows in the file, including the header.
+    """
+    with open(path, newline="", encoding="utf-8") as csvfile:
+        return list(csv.reader(csvfile))
+
+
+def test_writes_one_row_per_pair(tmp_path: Path) -> None:
+    """Test that each rate of a successful result becomes its own row."""
+    results: list[CurrencyResult] = [
+        CurrencyResult(
+            success=True,
+            source="USD",
+            currencies=["EUR", "GBP"],
+            rates={"USDEUR": 0.85, "USDGBP": 0.74},
+        )
+    ]
+
+    path = asyncio.run(CSVWriter().async_write_to_file(results, tmp_path, "rates"))
+    rows = read_rows(path)
+
+    assert path == str((tmp_path / "rates.csv").absolute())
+    assert tuple(rows[0]) == FIELDNAMES
+    assert [row[:4] for row in rows[1:]] == [
+        ["USD", "EUR", "0.85", "USDEUR"],
+        ["USD", "GBP", "0.74", "USDGBP"],
+    ]
+    assert all(row[5] == "True" and row[6] == "" for row in rows[1:])
+
+
+def test_writes_single_row_for_failure(tmp_path: Path) -> None:
+    """Test that a failed result is written as one row with its reason."""
+    results: list[CurrencyResult] = [
+        CurrencyResult(
+            success=False,
+            source="GBP",
+            currencies=["EUR"],
+            rates={},
+            reason="Invalid API key",
+        )
+    ]
+
+    path = asyncio.run(CSVWriter().async_write_to_file(results, tmp_path, "rates.csv"))
+    rows = read_rows(path)
+
+    assert len(rows) == 2
+    assert rows[1][:4] == ["GBP", "", "0.0", ""]
+    assert rows[1][5:] == ["False", "Invalid API key"]
+
+
+def test_writes_header_only_for_no_data(tmp_path: Path) -> None:
+    """Test that an empty result list still produces a header row."""
+    path = asyncio.run(CSVWriter().async_write_to_file([], tmp_path, "empty.csv"))
+
+    assert read_rows(path) == [list(FIELDNAMES)]
+
+
+def test_quotes_reason_with_special_characters(tmp_path: Path) -> None:
+    """Test that a reason containing commas, quotes or newlines round-trips."""
+    reason = 'Bad "source", try\nagain'
+    results: list[CurrencyResult] = [
+        CurrencyResult(
+            success=False,
+            source="GBP",
+            currencies=["EUR"],
+            rates={},
+            reason=reason,
+        )
+    ]
+
+    path = asyncio.run(CSVWriter().async_write_to_file(results, tmp_path, "rates.csv"))
+    rows = read_rows(path)
+
+    assert len(rows) == 2
+    assert rows[1][6] == reason
+
+
+def test_stream_matches_batch_output(tmp_path: Path) -> None:
+    """Test that streaming results writes the same rows as a batch write."""
+    results: list[CurrencyResult] = [
+        CurrencyResult(
+            success=True,
+            source="USD",
+            currencies=["EUR", "GBP"],
+            rates={"USDEUR": 0.85, "USDGBP": 0.74},
+        ),
+        CurrencyResult(
+            success=False,
+            source="GBP",
+            currencies=["EUR", "GBP"],
+            rates={},
+            reason="Invalid API key",
+        ),
+    ]
+
+    async def stream() -> AsyncIterator[CurrencyResult]:
+        for result in results:
+            yield result
+
+    writer = CSVWriter()
+    batch_path = asyncio.run(writer.async_write_to_file(results, tmp_path, "batch"))
+    stream_path = asyncio.run(writer.async_write_stream(stream(), tmp_path, "stream"))
+
+    # Timestamps differ between the two writes, so compare everything else
+    def without_timestamps(path: str) -> list[list[str]]:
+        return [row[:4] + row[5:] for row in read_rows(path)]
+
+    assert stream_path == str((tmp_path / "stream.csv").absolute())
+    assert without_timestamps(stream_path) == without_timestamps(batch_path)
+
+
+def test_fsync_writes_same_output(tmp_path: Path) -> None:
+    """Test that syncing to disk does not change the written file."""
+    results: list[CurrencyResult] = [
+        CurrencyResult(
+            success=True,
+            source="USD",
+            currencies=["EUR"],
+            rates={"USDEUR": 0.85},
+        )
+    ]
+
+    path = asyncio.run(
+        CSVWriter(fsync=True).async_write_to_file(results, tmp_path, "rates.csv")
+    )
+
+    assert read_rows(path)[1][:4] == ["USD", "EUR", "0.85", "USDEUR"]
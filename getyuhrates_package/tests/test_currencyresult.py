@@ -1,8 +1,12 @@
-"""Tests for CurrencyResult TypedDict.
+"""Tests for the CurrencyResult dataclass.
 
 This module contains tests to verify the CurrencyResult structure and usage.
 """
 
+import dataclasses
+
+import pytest
+
 from getyuhrates.currencyresult import CurrencyResult
 
 
@@ -11,22 +15,20 @@ def test_currency_result_structure() -> None:
 
     This test verifies the structure of a successful CurrencyResult.
     """
-    result: CurrencyResult = {
-        "success": True,
-        "source": "USD",
-        "currencies": ["EUR", "GBP"],
-        "rates": {"USDEUR": 0.85, "USDGBP": 0.74},
-        "reason": None,
-        "file_location": None,
-    }
-
-    assert result["success"] is True
-    assert result["source"] == "USD"
-    assert result["currencies"] == ["EUR", "GBP"]
-    assert result["rates"]["USDEUR"] == 0.85
-    assert result["rates"]["USDGBP"] == 0.74
-    assert result["reason"] is None
-    assert result["file_location"] is None
+    result = CurrencyResult(
+        success=True,
+        source="USD",
+        currencies=["EUR", "GBP"],
+        rates={"USDEUR": 0.85, "USDGBP": 0.74},
+    )
+
+    assert result.success is True
+    assert result.source == "USD"
+    assert result.currencies == ["EUR", "GBP"]
+    assert result.rates["USDEUR"] == 0.85
+    assert result.rates["USDGBP"] == 0.74
+    assert result.reason is None
+    assert result.file_location is None
 
 
 def test_currency_result_failure() -> None:
@@ -34,18 +36,17 @@ def test_currency_result_failure() -> None:
 
     This test verifies the structure of a failed CurrencyResult.
     """
-    result: CurrencyResult = {
-        "success": False,
-        "source": "USD",
-        "currencies": ["EUR"],
-        "rates": {},
-        "reason": "Invalid API key",
-        "file_location": None,
-    }
+    result = CurrencyResult(
+        success=False,
+        source="USD",
+        currencies=["EUR"],
+        rates={},
+        reason="Invalid API key",
+    )
 
-    assert result["success"] is False
-    assert result["reason"] == "Invalid API key"
-    assert len(result["rates"]) == 0
+    assert result.success is False
+    assert result.reason == "Invalid API key"
+    assert len(result.rates) == 0
 
 
 def test_currency_result_with_file() -> None:
@@ -53,14 +54,34 @@ def test_currency_result_with_file() -> None:
 
     This test verifies that file_location field works correctly.
     """
-    result: CurrencyResult = {
-        "success": True,
-        "source": "GBP",
-        "currencies": ["BBD"],
-        "rates": {"GBPBBD": 2.5},
-        "reason": None,
-        "file_location": "/tmp/output/rates.csv",
-    }
-
-    assert result["file_location"] == "/tmp/output/rates.csv"
-    assert result["source"] == "GBP"
+    result = CurrencyResult(
+        success=True,
+        source="GBP",
+        currencies=["BBD"],
+        rates={"GBPBBD": 2.5},
+        file_location="/tmp/output/rates.csv",
+    )
+
+    assert result.file_location == "/tmp/output/rates.csv"
+    assert result.source == "GBP"
+
+
+def test_currency_result_is_immutable() -> None:
+    """Test that CurrencyResult fields cannot be reassigned.
+
+    This test verifies that dataclasses.replace is needed to derive a result
+    with a different file location.
+    """
+    result = CurrencyResult(
+        success=True,
+        source="USD",
+        currencies=["EUR"],
+        rates={"USDEUR": 0.85},
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(result, "file_location", "/tmp/output/rates.csv")
+
+    updated = dataclasses.replace(result, file_location="/tmp/output/rates.csv")
+    assert updated.file_location == "/tmp/output/rates.csv"
+    assert result.file_location is None
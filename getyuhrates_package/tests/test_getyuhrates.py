@@ -0,0 +1,386 @@
+"""Tests for the GetYuhRates client.
+
+This module contains tests for how the client builds results, using a stand-in
+HTTP session instead of calling the API.
+"""
+
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterable
+from types import TracebackType
+from typing import Callable, Self, cast, override
+
+import aiohttp
+import pytest
+
+from getyuhrates import CSVWriter, CurrencyResult, GetYuhRates
+
+# Rates of other currencies against the anchor currency (USD)
+USD_QUOTES: dict[str, float] = {"USDEUR": 0.9, "USDGBP": 0.8, "USDCAD": 1.4}
+
+
+class FakeResponse:
+    """Stand-in for an aiohttp response with a fixed status and JSON body."""
+
+    def __init__(self, status: int, data: dict[str, object]) -> None:
+        """Initialize the response.
+
+        Args:
+            status (int): HTTP status code.
+            data (dict[str, object]): JSON body.
+        """
+        self.status: int = status
+        self.text: str = json.dumps(data)
+
+    async def __aenter__(self) -> Self:
+        """Enter the response context.
+
+        Returns:
+            Self: This response.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Exit the response context."""
+
+    async def json(self, loads: Callable[[str], object]) -> object:
+        """Parse the JSON body.
+
+        Args:
+            loads (Callable[[str], object]): JSON decoder to parse the body with.
+
+        Returns:
+            object: Parsed JSON body.
+        """
+        return loads(self.text)
+
+
+class SlowResponse(FakeResponse):
+    """Stand-in for an aiohttp response whose body never arrives.
+
+    Attributes:
+        cancelled (bool): Whether the request was cancelled while waiting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the response."""
+        super().__init__(200, {})
+        self.cancelled: bool = False
+
+    @override
+    async def json(self, loads: Callable[[str], object]) -> object:
+        """Wait for a body until the request is cancelled.
+
+        Args:
+            loads (Callable[[str], object]): JSON decoder to parse the body with.
+
+        Returns:
+            object: Never returns.
+        """
+        try:
+            _ = await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return loads(self.text)
+
+
+class RecordingWriter(CSVWriter):
+    """Stand-in for CSVWriter that records streamed results instead of writing them.
+
+    Attributes:
+        sources (list[str]): Source currency of each result received.
+        fail_after (int | None): Number of results after which writing fails,
+            or None to never fail.
+    """
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        """Initialize the writer.
+
+        Args:
+            fail_after (int | None): Number of results after which writing
+                fails, or None to never fail.
+        """
+        super().__init__()
+        self.sources: list[str] = []
+        self.fail_after: int | None = fail_after
+
+    @override
+    async def async_write_stream(
+        self,
+        results: AsyncIterable[CurrencyResult],
+        output_folder: os.PathLike[str],
+        filename: str | None,
+    ) -> str:
+        """Record the source of each result as it arrives.
+
+        Args:
+            results (AsyncIterable[CurrencyResult]): Results to record.
+            output_folder (os.PathLike[str]): Directory the file would be written to.
+            filename (str | None): Name the file would be given.
+
+        Returns:
+            str: Path the file would have been written to.
+
+        Raises:
+            OSError: Once fail_after results have been received.
+        """
+        async for result in results:
+            self.sources.append(result.source)
+            if self.fail_after is not None and len(self.sources) >= self.fail_after:
+                raise OSError("No space left on device")
+        return os.path.join(os.fspath(output_folder), filename or "rates.csv")
+
+
+class FakeSession:
+    """Stand-in for an aiohttp session that answers requests per source currency.
+
+    Attributes:
+        responses (dict[str, FakeResponse]): Response for each source currency.
+        requests (list[dict[str, str | int]]): Parameters of every request made.
+    """
+
+    def __init__(self, responses: dict[str, FakeResponse]) -> None:
+        """Initialize the session.
+
+        Args:
+            responses (dict[str, FakeResponse]): Response for each source currency.
+        """
+        self.responses: dict[str, FakeResponse] = responses
+        self.requests: list[dict[str, str | int]] = []
+
+    def get(self, _url: str, params: dict[str, str | int]) -> FakeResponse:
+        """Record a request and get the response for its source currency.
+
+        Args:
+            _url (str): Requested URL, the same for every request.
+            params (dict[str, str | int]): Query parameters of the request.
+
+        Returns:
+            FakeResponse: Response for the requested source currency.
+        """
+        self.requests.append(params)
+        return self.responses[str(params["source"])]
+
+
+def quotes_response(source: str, quotes: dict[str, float]) -> FakeResponse:
+    """Build a successful API response.
+
+    Args:
+        source (str): Source currency of the quotes.
+        quotes (dict[str, float]): Rates keyed by currency pair.
+
+    Returns:
+        FakeResponse: Response with the quotes.
+    """
+    return FakeResponse(200, {"success": True, "source": source, "quotes": quotes})
+
+
+def error_response(code: int, info: str) -> FakeResponse:
+    """Build a failed API response.
+
+    Args:
+        code (int): CurrencyLayer error code.
+        info (str): Error message.
+
+    Returns:
+        FakeResponse: Response with the error.
+    """
+    return FakeResponse(200, {"success": False, "error": {"code": code, "info": info}})
+
+
+@pytest.fixture
+def make_client(monkeypatch: pytest.MonkeyPatch) -> Callable[[FakeSession], GetYuhRates]:
+    """Get a factory for clients that send requests to a fake session without pacing.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to set the client's environment.
+
+    Returns:
+        Callable[[FakeSession], GetYuhRates]: Builds a client using the session.
+    """
+    monkeypatch.setenv("CURRENCYLAYER_API_KEY", "test-key")
+    monkeypatch.setenv("GETYUHRATES_REQUEST_DELAY_SECONDS", "0")
+
+    def make(session: FakeSession) -> GetYuhRates:
+        return GetYuhRates(session=cast(aiohttp.ClientSession, cast(object, session)))
+
+    return make
+
+
+def test_self_conversion_results_are_independent(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that converting a currency to itself returns a new result every call.
+
+    This test verifies that modifying one result does not affect later results
+    for the same currency, and that each result keeps the requested currencies.
+    """
+    monkeypatch.setenv("CURRENCYLAYER_API_KEY", "test-key")
+    client = GetYuhRates()
+
+    first = asyncio.run(client.get_rates_async(["USD"], ["USD"]))[0]
+    first.rates["USDEUR"] = 0.85
+    first.currencies.append("EUR")
+
+    currencies = ["USD", "USD"]
+    second = asyncio.run(client.get_rates_async(["USD"], currencies))[0]
+
+    assert second is not first
+    assert second.success is True
+    assert second.rates == {"USDUSD": 1.0}
+    assert second.currencies == currencies
+
+
+def test_anchor_request_derives_cross_rates(
+    make_client: Callable[[FakeSession], GetYuhRates],
+) -> None:
+    """Test that rates for several sources come from one anchor request.
+
+    This test verifies that each source's rates are derived from the anchor
+    rates and rounded to the API's precision.
+    """
+    session = FakeSession({"USD": quotes_response("USD", USD_QUOTES)})
+    client = make_client(session)
+
+    results = asyncio.run(client.get_rates_async(["GBP", "EUR"], ["CAD", "USD"]))
+
+    assert len(session.requests) == 1
+    assert session.requests[0]["currencies"] == "GBP,EUR,CAD"
+    assert [result.source for result in results] == ["GBP", "EUR"]
+    assert all(result.success for result in results)
+    assert results[0].rates == {"GBPCAD": 1.75, "GBPUSD": 1.25}
+    assert results[1].rates == {"EURCAD": 1.555556, "EURUSD": 1.111111}
+
+
+def test_missing_anchor_quote_falls_back_per_source(
+    make_client: Callable[[FakeSession], GetYuhRates],
+) -> None:
+    """Test that a source missing from the anchor quotes is fetched on its own.
+
+    This test verifies that every source gets its own request when the anchor
+    response does not include a rate for one of the currencies.
+    """
+    session = FakeSession(
+        {
+            "USD": quotes_response("USD", {"USDEUR": 0.9}),
+            "GBP": quotes_response("GBP", {"GBPEUR": 1.125}),
+        }
+    )
+    client = make_client(session)
+
+    results = asyncio.run(client.get_rates_async(["USD", "GBP"], ["EUR"]))
+
+    assert [request["source"] for request in session.requests] == ["USD", "USD", "GBP"]
+    assert results[0].rates == {"USDEUR": 0.9}
+    assert results[1].rates == {"GBPEUR": 1.125}
+
+
+def test_invalid_currency_falls_back_per_source(
+    make_client: Callable[[FakeSession], GetYuhRates],
+) -> None:
+    """Test that a currency rejected by the anchor request is fetched per source.
+
+    This test verifies that the per-source requests report the error only for
+    the source it applies to.
+    """
+    session = FakeSession(
+        {
+            "USD": error_response(202, "You have provided invalid Currency Codes."),
+            "XXX": error_response(201, "You have supplied an invalid Source Currency."),
+        }
+    )
+    client = make_client(session)
+
+    results = asyncio.run(client.get_rates_async(["USD", "XXX"], ["USD"]))
+
+    assert [request["source"] for request in session.requests] == ["USD", "XXX"]
+    assert results[0].success is True
+    assert results[0].rates == {"USDUSD": 1.0}
+    assert results[1].success is False
+    assert results[1].reason == "You have supplied an invalid Source Currency."
+
+
+def test_account_error_is_not_retried_per_source(
+    make_client: Callable[[FakeSession], GetYuhRates],
+) -> None:
+    """Test that an error affecting every request is returned for all sources.
+
+    This test verifies that an invalid API key on the anchor request does not
+    lead to a further request per source.
+    """
+    session = FakeSession(
+        {"USD": error_response(101, "You have not supplied a valid API Access Key.")}
+    )
+    client = make_client(session)
+
+    results = asyncio.run(client.get_rates_async(["USD", "GBP"], ["EUR"]))
+
+    assert len(session.requests) == 1
+    assert [result.source for result in results] == ["USD", "GBP"]
+    assert all(result.success is False for result in results)
+    assert all(
+        result.reason == "You have not supplied a valid API Access Key."
+        for result in results
+    )
+
+
+def test_stream_returns_file_and_failures(
+    make_client: Callable[[FakeSession], GetYuhRates],
+) -> None:
+    """Test that streaming returns the file location and only failed results.
+
+    This test verifies that every result is passed to the writer, while only
+    failures are kept and returned with the file location.
+    """
+    session = FakeSession(
+        {
+            "USD": error_response(202, "You have provided invalid Currency Codes."),
+            "GBP": quotes_response("GBP", {"GBPEUR": 1.125}),
+            "XXX": error_response(201, "You have supplied an invalid Source Currency."),
+        }
+    )
+    writer = RecordingWriter()
+    client = make_client(session)
+
+    file_path, failures = asyncio.run(
+        client.stream_rates_to_csv(["GBP", "XXX"], ["EUR"], "output", writer=writer)
+    )
+
+    assert file_path == os.path.join("output", "rates.csv")
+    assert sorted(writer.sources) == ["GBP", "XXX"]
+    assert [failure.source for failure in failures] == ["XXX"]
+    assert failures[0].file_location == file_path
+
+
+def test_stream_cancels_requests_when_writer_fails(
+    make_client: Callable[[FakeSession], GetYuhRates],
+) -> None:
+    """Test that a failing writer cancels the requests still in flight.
+
+    This test verifies that the writer's error is raised only after the
+    pending request has been cancelled.
+    """
+    slow = SlowResponse()
+    session = FakeSession(
+        {"USD": quotes_response("USD", {"USDEUR": 0.9}), "GBP": slow}
+    )
+    writer = RecordingWriter(fail_after=1)
+    client = make_client(session)
+
+    async def stream() -> bool:
+        with pytest.raises(OSError, match="No space left on device"):
+            _ = await client.stream_rates_to_csv(
+                ["USD", "GBP"], ["EUR"], "output", writer=writer
+            )
+        # Checked before asyncio.run cancels whatever is left on the loop
+        return slow.cancelled
+
+    assert asyncio.run(stream()) is True
+    assert writer.sources == ["USD"]
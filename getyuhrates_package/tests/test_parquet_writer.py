@@ -0,0 +1,78 @@
+"""Tests for the ParquetWriter.
+
+This module contains tests to verify the schema and rows written to Parquet
+files. They are skipped when pyarrow is not installed.
+"""
+
+import asyncio
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from getyuhrates.csv_writer import FIELDNAMES, CSVWriter
+from getyuhrates.currencyresult import CurrencyResult
+from getyuhrates.parquet_writer import ParquetWriter
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_writes_schema_and_rows(tmp_path: Path) -> None:
+    """Test that results are written with typed columns, one row per pair.
+
+    This test verifies that a failed result is written as a single row with
+    its reason, as in CSVWriter.
+    """
+    results: list[CurrencyResult] = [
+        CurrencyResult(
+            success=True,
+            source="USD",
+            currencies=["EUR", "GBP"],
+            rates={"USDEUR": 0.85, "USDGBP": 0.74},
+        ),
+        CurrencyResult(
+            success=False,
+            source="GBP",
+            currencies=["EUR"],
+            rates={},
+            reason="Invalid API key",
+        ),
+    ]
+
+    path = asyncio.run(ParquetWriter().async_write_to_file(results, tmp_path, "rates"))
+    table = pq.read_table(path)
+
+    assert path == str((tmp_path / "rates.parquet").absolute())
+    assert tuple(table.column_names) == FIELDNAMES
+    assert table.schema.field("rate").type == pa.float64()
+    assert table.schema.field("timestamp").type == pa.timestamp("us")
+    assert table.schema.field("success").type == pa.bool_()
+
+    columns = table.drop_columns(["timestamp"]).to_pydict()
+    assert columns == {
+        "source": ["USD", "USD", "GBP"],
+        "target": ["EUR", "GBP", ""],
+        "rate": [0.85, 0.74, 0.0],
+        "pair": ["USDEUR", "USDGBP", ""],
+        "success": [True, True, False],
+        "reason": ["", "", "Invalid API key"],
+    }
+
+
+def test_default_filename_matches_csv_writer(tmp_path: Path) -> None:
+    """Test that generated filenames follow the same pattern as CSVWriter's.
+
+    This test verifies that only the extension differs between the two writers.
+    """
+    results: list[CurrencyResult] = []
+
+    parquet_path = asyncio.run(
+        ParquetWriter().async_write_to_file(results, tmp_path, None)
+    )
+    csv_path = asyncio.run(CSVWriter().async_write_to_file(results, tmp_path, None))
+
+    pattern = r"currency_rates_\d{8}_\d{6}"
+    assert re.fullmatch(pattern + r"\.parquet", os.path.basename(parquet_path))
+    assert re.fullmatch(pattern + r"\.csv", os.path.basename(csv_path))
@@ -0,0 +1,141 @@
+"""Tests for the RateLimiter token bucket.
+
+This module contains tests to verify request pacing behaviour.
+"""
+
+import asyncio
+
+import pytest
+
+from getyuhrates import ratelimiter
+from getyuhrates.ratelimiter import RateLimiter
+
+
+class FakeClock:
+    """Stand-in for time.monotonic and asyncio.sleep that never blocks."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero with no recorded sleeps."""
+        self.now: float = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return the current fake time.
+
+        Returns:
+            float: Current fake time in seconds.
+        """
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        """Record a sleep and advance the fake time.
+
+        Args:
+            seconds (float): Duration of the sleep.
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch the rate limiter to use a fake clock.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+
+    Returns:
+        FakeClock: The fake clock driving the rate limiter.
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(ratelimiter.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def test_burst_is_sent_without_waiting(clock: FakeClock) -> None:
+    """Test that requests up to the burst size do not wait."""
+    limiter = RateLimiter(delay_seconds=1.0, burst=3)
+
+    async def run() -> None:
+        for _ in range(3):
+            await limiter.wait_if_needed()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == []
+
+
+def test_requests_beyond_burst_are_paced(clock: FakeClock) -> None:
+    """Test that once the bucket is empty each request waits for a refill."""
+    limiter = RateLimiter(delay_seconds=2.0, burst=1)
+
+    async def run() -> None:
+        for _ in range(3):
+            await limiter.wait_if_needed()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == pytest.approx([2.0, 2.0])
+
+
+def test_idle_time_refills_bucket(clock: FakeClock) -> None:
+    """Test that tokens accumulate while the limiter is idle."""
+    limiter = RateLimiter(delay_seconds=1.0, burst=2)
+
+    async def run() -> None:
+        await limiter.wait_if_needed()
+        await limiter.wait_if_needed()
+        clock.now += 5.0
+        await limiter.wait_if_needed()
+        await limiter.wait_if_needed()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == []
+
+
+def test_zero_delay_disables_limiting(clock: FakeClock) -> None:
+    """Test that a delay of zero never waits."""
+    limiter = RateLimiter(delay_seconds=0)
+
+    async def run() -> None:
+        for _ in range(5):
+            await limiter.wait_if_needed()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == []
+
+
+def test_backoff_doubles_interval(clock: FakeClock) -> None:
+    """Test that backing off doubles the wait between requests."""
+    limiter = RateLimiter(delay_seconds=1.0, burst=1)
+    limiter.backoff()
+
+    async def run() -> None:
+        await limiter.wait_if_needed()
+        await limiter.wait_if_needed()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == pytest.approx([2.0])
+
+
+def test_backoff_is_capped_at_max_delay() -> None:
+    """Test that repeated backoffs never exceed max_delay."""
+    limiter = RateLimiter(delay_seconds=1.0, max_delay=5.0)
+    for _ in range(10):
+        limiter.backoff()
+
+    assert limiter.refill_rate == pytest.approx(1 / 5.0)
+
+
+def test_recover_returns_to_configured_delay() -> None:
+    """Test that successful requests shrink the interval back to delay_seconds."""
+    limiter = RateLimiter(delay_seconds=1.0)
+    limiter.backoff()
+    for _ in range(20):
+        limiter.recover()
+
+    assert limiter.refill_rate == pytest.approx(1.0)
@@ -1,11 +1,40 @@
 """Configuration management utilities for the GetYuhRates web application."""
 
+import asyncio
+import logging
 import os
+from copy import deepcopy
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 from dotenv import load_dotenv
+from fastapi import Request
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader and dumper; they are much faster than the
+# pure-Python ones.
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+    logger.warning(
+        "PyYAML was built without libyaml; using the slower pure-Python "
+        "YAML parser. Install libyaml-dev and reinstall PyYAML to enable it."
+    )
+
+
+class ConfigValidationError(ValueError):
+    """Raised when a config.yaml setting holds a value of the wrong type."""
+
+
+# Parsed config files keyed by path, with the st_mtime_ns they were parsed at
+_CONFIG_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
 
 
 class ConfigManager:
@@ -29,6 +58,9 @@ class ConfigManager:
     def read_config(self) -> dict[str, Any]:
         """Read the configuration file.
 
+        The parsed file is cached and only parsed again once its modification
+        time changes. Each call returns its own copy, so callers may modify it.
+
         Returns:
             dict[str, Any]: Configuration data.
 
@@ -36,16 +68,25 @@ class ConfigManager:
             FileNotFoundError: If config file doesn't exist.
             yaml.YAMLError: If config file is invalid YAML.
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {self.config_path}")
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Config file not found: {self.config_path}"
+            ) from None
+
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return deepcopy(cached[1])
 
         with open(self.config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_Loader)
 
         if config is None:
-            return {}
+            config = {}
 
-        return config
+        _CONFIG_CACHE[self.config_path] = (mtime_ns, config)
+        return deepcopy(config)
 
     def write_config(self, config: dict[str, Any]) -> None:
         """Write configuration to file.
@@ -66,8 +107,23 @@ class ConfigManager:
         if "output_folder" in existing_config:
             config["output_folder"] = existing_config["output_folder"]
 
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        # Write to a temporary file next to config.yaml and swap it into place,
+        # so a crash mid-write never leaves a truncated or half-written config
+        tmp_path = self.config_path.with_suffix(".yaml.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                yaml.dump(
+                    config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # The new mtime may match the cached one on coarse-grained filesystems
+        _ = _CONFIG_CACHE.pop(self.config_path, None)
 
     def get_value(self, key: str, default: Any = None) -> Any:
         """Get a specific configuration value.
@@ -102,6 +158,156 @@ class ConfigManager:
         self.write_config(config)
 
 
+# Shared manager for the application's config.yaml
+config_manager = ConfigManager()
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Snapshot of config.yaml loaded when the application starts.
+
+    Routes read settings from this object instead of parsing config.yaml on
+    every request. It is replaced whenever the configuration is updated
+    through the web interface; edits made to config.yaml by other means are
+    picked up on the next restart.
+
+    Attributes:
+        source (tuple[str, ...]): Source currencies.
+        currencies (tuple[str, ...]): Target currencies.
+        always_download (str): Always download setting (Y/N).
+        output_folder (str): Output folder path.
+        output_format (str): Output format.
+        send_emails (bool): Send emails flag.
+        sender_email (str): Sender email address.
+        recipients (tuple[str, ...]): Recipient email addresses.
+        subject_title (str): Email subject.
+        email_body (str): Email body.
+    """
+
+    source: tuple[str, ...] = ("USD",)
+    currencies: tuple[str, ...] = ("EUR",)
+    always_download: str = "N"
+    output_folder: str = "./reports/"
+    output_format: str = "CSV"
+    send_emails: bool = False
+    sender_email: str = ""
+    recipients: tuple[str, ...] = ()
+    subject_title: str = ""
+    email_body: str = ""
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "AppConfig":
+        """Build an AppConfig from parsed config.yaml data.
+
+        Keys that are missing or have no value keep their default values. A
+        single currency or recipient may be given as a plain string instead
+        of a list.
+
+        Args:
+            config (dict[str, Any]): Configuration data.
+
+        Returns:
+            AppConfig: The configuration snapshot.
+
+        Raises:
+            ConfigValidationError: If a list setting holds something other
+                than a list or a string.
+        """
+        defaults = cls()
+        return cls(
+            source=_tuple_value(config, "source", defaults.source),
+            currencies=_tuple_value(config, "currencies", defaults.currencies),
+            always_download=_str_value(config, "always_download", defaults.always_download),
+            output_folder=_str_value(config, "output_folder", defaults.output_folder),
+            output_format=_str_value(config, "output_format", defaults.output_format),
+            send_emails=bool(config.get("send_emails", defaults.send_emails)),
+            sender_email=_str_value(config, "sender_email", defaults.sender_email),
+            recipients=_tuple_value(config, "recipients", defaults.recipients),
+            subject_title=_str_value(config, "subject_title", defaults.subject_title),
+            email_body=_str_value(config, "email_body", defaults.email_body),
+        )
+
+
+def _tuple_value(
+    config: dict[str, Any], key: str, default: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Read a list setting from parsed config.yaml data.
+
+    Args:
+        config (dict[str, Any]): Configuration data.
+        key (str): Name of the setting.
+        default (tuple[str, ...]): Value used if the setting is missing or empty.
+
+    Returns:
+        tuple[str, ...]: The setting's items.
+
+    Raises:
+        ConfigValidationError: If the setting is neither a list nor a string.
+    """
+    value: Any = config.get(key) or default
+    if isinstance(value, str):
+        return (value,)
+    if not isinstance(value, (list, tuple)):
+        raise ConfigValidationError(
+            f"'{key}' in config.yaml must be a list, not {type(value).__name__}"
+        )
+    return tuple(str(item) for item in value)
+
+
+def _str_value(config: dict[str, Any], key: str, default: str) -> str:
+    """Read a text setting from parsed config.yaml data.
+
+    Args:
+        config (dict[str, Any]): Configuration data.
+        key (str): Name of the setting.
+        default (str): Value used if the setting is missing or has no value.
+
+    Returns:
+        str: The setting's value.
+    """
+    value = config.get(key)
+    return default if value is None else str(value)
+
+
+def load_app_config() -> AppConfig:
+    """Read config.yaml into an AppConfig.
+
+    Returns:
+        AppConfig: The configuration snapshot.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist.
+        yaml.YAMLError: If config file is invalid YAML.
+        ConfigValidationError: If a setting holds a value of the wrong type.
+    """
+    return AppConfig.from_dict(config_manager.read_config())
+
+
+async def get_app_config(request: Request) -> AppConfig:
+    """Get the configuration snapshot of the running application.
+
+    The snapshot is loaded at startup. If config.yaml did not exist then, it
+    is loaded on first use instead, on a worker thread so the event loop
+    isn't blocked while the file is read.
+
+    Args:
+        request (Request): The HTTP request object.
+
+    Returns:
+        AppConfig: The configuration snapshot.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist.
+        yaml.YAMLError: If config file is invalid YAML.
+        ConfigValidationError: If a setting holds a value of the wrong type.
+    """
+    app_config: AppConfig | None = getattr(request.app.state, "app_config", None)
+    if app_config is None:
+        app_config = await asyncio.to_thread(load_app_config)
+        request.app.state.app_config = app_config
+    return app_config
+
+
 def load_env() -> None:
     """Load environment variables from .env file."""
     load_dotenv()
@@ -116,17 +322,17 @@ def get_api_key() -> str | None:
     return os.getenv("CURRENCYLAYER_API_KEY")
 
 
-def get_reports_dir() -> Path:
+def get_reports_dir(app_config: AppConfig) -> Path:
     """Get the reports directory path.
 
+    This does not touch the filesystem. The directory is created at startup
+    and again before each report is saved, so it may not exist yet if
+    config.yaml was added after the application started.
+
+    Args:
+        app_config (AppConfig): Configuration of the running application.
+
     Returns:
         Path: Path to the reports directory.
     """
-    config_manager = ConfigManager()
-    output_folder = config_manager.get_value("output_folder", "./reports/")
-    reports_path = Path(output_folder)
-
-    # Create directory if it doesn't exist
-    reports_path.mkdir(parents=True, exist_ok=True)
-
-    return reports_path
+    return Path(app_config.output_folder)
@@ -0,0 +1,13 @@
+"""Constants shared across the GetYuhRates web application."""
+
+from typing import Literal, get_args
+
+# Common currency codes, accepted in rate requests and offered in the
+# currency dropdowns
+type CurrencyCode = Literal[
+    "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY",
+    "BBD", "PLN", "SEK", "NOK", "DKK", "NZD", "SGD", "HKD",
+    "KRW", "MXN", "INR", "BRL", "ZAR", "RUB", "TRY",
+]
+
+AVAILABLE_CURRENCIES: tuple[str, ...] = get_args(CurrencyCode.__value__)
@@ -6,8 +6,9 @@ from typing import AsyncIterator
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
-from .config import load_env
+from .config import get_reports_dir, load_app_config, load_env
 from .routes import home, rates, reports, config
+from .templates_env import preload_templates
 
 
 @asynccontextmanager
@@ -25,6 +26,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup: Load environment variables
     load_env()
 
+    # Load config.yaml once; routes read this snapshot instead of the file.
+    # If it doesn't exist yet, it is loaded on first use instead.
+    try:
+        app.state.app_config = load_app_config()
+    except FileNotFoundError:
+        app.state.app_config = None
+    else:
+        # Create the reports directory once rather than on every request
+        get_reports_dir(app.state.app_config).mkdir(parents=True, exist_ok=True)
+
+    # Compile the page templates now rather than on their first request
+    preload_templates()
+
     yield
 
     # Shutdown: Clean up resources if needed
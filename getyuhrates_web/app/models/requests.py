@@ -1,23 +1,27 @@
 """Request models for the GetYuhRates web application."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..constants import CurrencyCode
 
 
 class CurrencyRateRequest(BaseModel):
     """Request model for currency rate retrieval.
 
     Attributes:
-        source (list[str]): List of source currency codes (e.g., ["USD", "GBP"]).
-        currencies (list[str]): List of target currency codes to convert to.
+        source (list[CurrencyCode]): List of source currency codes (e.g., ["USD", "GBP"]).
+        currencies (list[CurrencyCode]): List of target currency codes to convert to.
         save_to_file (bool): Whether to save the results to a CSV file.
     """
 
-    source: list[str] = Field(
+    source: list[CurrencyCode] = Field(
         ...,
         min_length=1,
         description="Source currency codes"
     )
-    currencies: list[str] = Field(
+    currencies: list[CurrencyCode] = Field(
         ...,
         min_length=1,
         description="Target currency codes"
@@ -27,6 +31,24 @@ class CurrencyRateRequest(BaseModel):
         description="Whether to save results to CSV"
     )
 
+    @field_validator("source", "currencies")
+    @classmethod
+    def reject_duplicates(cls, codes: list[CurrencyCode]) -> list[CurrencyCode]:
+        """Reject currency lists that contain the same code more than once.
+
+        Args:
+            codes (list[CurrencyCode]): The currency codes to check.
+
+        Returns:
+            list[CurrencyCode]: The currency codes, unchanged.
+
+        Raises:
+            ValueError: If a currency code appears more than once.
+        """
+        if len(frozenset(codes)) != len(codes):
+            raise ValueError("Currency codes must not be repeated")
+        return codes
+
 
 class ConfigUpdateRequest(BaseModel):
     """Request model for configuration updates.
@@ -34,8 +56,8 @@ class ConfigUpdateRequest(BaseModel):
     Attributes:
         source (list[str]): Default source currencies.
         currencies (list[str]): Default target currencies.
-        always_download (str): Whether to always download files (Y/N).
-        output_format (str): Output format (CSV or PDF).
+        always_download (Literal["Y", "N"]): Whether to always download files.
+        output_format (Literal["CSV", "PDF"]): Output format.
         send_emails (bool): Whether to send email notifications.
         sender_email (str): Email address for sending notifications.
         recipients (list[str]): List of recipient email addresses.
@@ -53,14 +75,12 @@ class ConfigUpdateRequest(BaseModel):
         min_length=1,
         description="Default target currencies"
     )
-    always_download: str = Field(
+    always_download: Literal["Y", "N"] = Field(
         ...,
-        pattern="^[YN]$",
         description="Always download files (Y or N)"
     )
-    output_format: str = Field(
+    output_format: Literal["CSV", "PDF"] = Field(
         ...,
-        pattern="^(CSV|PDF)$",
         description="Output format (CSV or PDF)"
     )
     send_emails: bool = Field(
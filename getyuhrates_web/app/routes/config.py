@@ -1,24 +1,19 @@
 """Routes for configuration management."""
 
+import asyncio
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 
 from ..models.requests import ConfigUpdateRequest
 from ..models.responses import MessageResponse, ConfigResponse
-from ..config import ConfigManager
+from ..constants import AVAILABLE_CURRENCIES
+from ..config import config_manager, get_app_config, load_app_config
+from ..templates_env import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
-
-# Common currency codes
-AVAILABLE_CURRENCIES = [
-    "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY",
-    "BBD", "PLN", "SEK", "NOK", "DKK", "NZD", "SGD", "HKD",
-    "KRW", "MXN", "INR", "BRL", "ZAR", "RUB", "TRY"
-]
 
 
 @router.get("/config", response_class=HTMLResponse)
@@ -31,10 +26,8 @@ async def config_page(request: Request) -> Any:
     Returns:
         Any: Rendered HTML template.
     """
-    config_manager = ConfigManager()
-
     try:
-        config = config_manager.read_config()
+        config = await get_app_config(request)
     except FileNotFoundError:
         raise HTTPException(
             status_code=500,
@@ -51,21 +44,30 @@ async def config_page(request: Request) -> Any:
     )
 
 
-@router.get("/config/data", response_model=ConfigResponse)
-async def get_config() -> dict[str, Any]:
+# AppConfig already coerces every field to its type when it's built, so the
+# model is only used to document the response, and the data is serialised
+# directly with orjson instead of being validated again
+@router.get(
+    "/config/data",
+    response_model=None,
+    response_class=JSONResponse,
+    responses={200: {"model": ConfigResponse}},
+)
+async def get_config(request: Request) -> Response:
     """Get current configuration as JSON.
 
+    Args:
+        request (Request): The HTTP request object.
+
     Returns:
-        dict[str, Any]: Current configuration data.
+        Response: Current configuration data as JSON.
 
     Raises:
         HTTPException: If configuration file cannot be read.
     """
-    config_manager = ConfigManager()
-
     try:
-        config = config_manager.read_config()
-        return config
+        config = await get_app_config(request)
+        return Response(content=orjson.dumps(config), media_type="application/json")
     except FileNotFoundError:
         raise HTTPException(
             status_code=500,
@@ -74,13 +76,16 @@ async def get_config() -> dict[str, Any]:
 
 
 @router.post("/config/update", response_model=MessageResponse)
-async def update_config(config_request: ConfigUpdateRequest) -> dict[str, Any]:
+async def update_config(
+    config_request: ConfigUpdateRequest, request: Request
+) -> dict[str, Any]:
     """Update configuration settings.
 
     Note: The output_folder setting is preserved and cannot be modified.
 
     Args:
         config_request (ConfigUpdateRequest): The configuration update request.
+        request (Request): The HTTP request object.
 
     Returns:
         dict[str, Any]: Success message.
@@ -88,24 +93,16 @@ async def update_config(config_request: ConfigUpdateRequest) -> dict[str, Any]:
     Raises:
         HTTPException: If configuration cannot be updated.
     """
-    config_manager = ConfigManager()
-
     try:
         # Convert Pydantic model to dict
-        new_config = {
-            "source": config_request.source,
-            "currencies": config_request.currencies,
-            "always_download": config_request.always_download,
-            "output_format": config_request.output_format,
-            "send_emails": config_request.send_emails,
-            "sender_email": config_request.sender_email,
-            "recipients": config_request.recipients,
-            "subject_title": config_request.subject_title,
-            "email_body": config_request.email_body,
-        }
+        new_config = config_request.model_dump()
+
+        # Write configuration (output_folder will be preserved). Reading,
+        # writing and syncing the file block, so run them on a worker thread
+        await asyncio.to_thread(config_manager.write_config, new_config)
 
-        # Write configuration (output_folder will be preserved)
-        config_manager.write_config(new_config)
+        # Replace the snapshot routes read from with the new configuration
+        request.app.state.app_config = await asyncio.to_thread(load_app_config)
 
         return {
             "message": "Configuration updated successfully",
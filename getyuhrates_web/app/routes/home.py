@@ -4,12 +4,12 @@ from typing import Any
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
-from .reports import get_report_files
+from ..config import get_app_config
+from ..templates_env import templates
+from .reports import get_recent_reports
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -23,8 +23,7 @@ async def home_page(request: Request) -> Any:
         Any: Rendered HTML template.
     """
     # Get recent reports (limit to 5)
-    all_reports = get_report_files()
-    recent_reports = all_reports[:5] if len(all_reports) > 5 else all_reports
+    recent_reports = get_recent_reports(await get_app_config(request), 5)
 
     return templates.TemplateResponse(
         "index.html",
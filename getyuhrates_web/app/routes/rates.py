@@ -1,25 +1,77 @@
 """Routes for currency rate requests."""
 
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import orjson
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 
 from ..models.requests import CurrencyRateRequest
 from ..models.responses import CurrencyRateResponse
-from ..config import ConfigManager, get_api_key
+from ..constants import AVAILABLE_CURRENCIES
+from ..config import get_api_key, get_app_config
+from ..templates_env import templates
+
+# The getyuhrates package is installed separately; if it's missing, the rest
+# of the app still works and fetch_rates reports the error instead
+_IMPORT_ERR: ImportError | None = None
+try:
+    from getyuhrates import GetYuhRates
+    from getyuhrates.csv_writer import CSVWriter
+except ImportError as e:
+    _IMPORT_ERR = e
+    # Type checkers keep the imported classes, which the annotations below use
+    if TYPE_CHECKING:
+        raise
+    GetYuhRates = None
+    CSVWriter = None
+
+
+class GetYuhRatesUnavailableError(RuntimeError):
+    """Raised when the getyuhrates package could not be imported."""
+
+    def __init__(self) -> None:
+        """Initialize the error with the reason the import failed."""
+        super().__init__(f"GetYuhRates package not available: {_IMPORT_ERR}")
+
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
 
-# Common currency codes
-AVAILABLE_CURRENCIES = [
-    "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY",
-    "BBD", "PLN", "SEK", "NOK", "DKK", "NZD", "SGD", "HKD",
-    "KRW", "MXN", "INR", "BRL", "ZAR", "RUB", "TRY"
-]
+
+@cache
+def _get_client() -> GetYuhRates:
+    """Get the GetYuhRates client shared by all requests.
+
+    The client is created on first use, once the API key is known to be set,
+    and reused afterwards so its rate limiter paces requests across the whole
+    application rather than per request.
+
+    Returns:
+        GetYuhRates: The shared client.
+
+    Raises:
+        GetYuhRatesUnavailableError: If the getyuhrates package is not installed.
+    """
+    if _IMPORT_ERR is not None:
+        raise GetYuhRatesUnavailableError()
+    return GetYuhRates()
+
+
+@cache
+def _get_writer() -> CSVWriter:
+    """Get the CSV writer shared by all requests.
+
+    Returns:
+        CSVWriter: The shared writer.
+
+    Raises:
+        GetYuhRatesUnavailableError: If the getyuhrates package is not installed.
+    """
+    if _IMPORT_ERR is not None:
+        raise GetYuhRatesUnavailableError()
+    return CSVWriter()
 
 
 @router.get("/rates", response_class=HTMLResponse)
@@ -32,11 +84,10 @@ async def rates_page(request: Request) -> Any:
     Returns:
         Any: Rendered HTML template.
     """
-    config_manager = ConfigManager()
-    config = config_manager.read_config()
+    config = await get_app_config(request)
 
-    default_source = config.get("source", ["USD"])
-    default_currencies = config.get("currencies", ["EUR"])
+    default_source = config.source
+    default_currencies = config.currencies
 
     return templates.TemplateResponse(
         "rates.html",
@@ -49,15 +100,26 @@ async def rates_page(request: Request) -> Any:
     )
 
 
-@router.post("/rates/fetch", response_model=list[CurrencyRateResponse])
-async def fetch_rates(rate_request: CurrencyRateRequest) -> list[dict[str, Any]]:
+# getyuhrates already returns typed CurrencyResult dataclasses, so the model
+# is only used to document the response; orjson serialises the dataclasses
+# directly instead of each rate being validated again
+@router.post(
+    "/rates/fetch",
+    response_model=None,
+    response_class=JSONResponse,
+    responses={200: {"model": list[CurrencyRateResponse]}},
+)
+async def fetch_rates(
+    rate_request: CurrencyRateRequest, request: Request
+) -> Response:
     """Fetch currency exchange rates from CurrencyLayer API.
 
     Args:
         rate_request (CurrencyRateRequest): The rate request parameters.
+        request (Request): The HTTP request object.
 
     Returns:
-        list[dict[str, Any]]: List of currency rate results.
+        Response: List of currency rate results as JSON.
 
     Raises:
         HTTPException: If API key is not configured or other errors occur.
@@ -70,39 +132,29 @@ async def fetch_rates(rate_request: CurrencyRateRequest) -> list[dict[str, Any]]
         )
 
     try:
-        # Import here to handle potential import issues gracefully
-        # type: ignore - ignoring type errors from getyuhrates package as it's in development
-        from getyuhrates import GetYuhRates  # type: ignore
-        from getyuhrates.csv_writer import CSVWriter  # type: ignore
-
-        client = GetYuhRates()
+        client = _get_client()
 
         # Prepare parameters
         output_path = None
         writer = None
 
         if rate_request.save_to_file:
-            config_manager = ConfigManager()
-            output_folder = config_manager.get_value("output_folder", "./reports/")
-            output_path = Path(output_folder)
+            output_path = Path((await get_app_config(request)).output_folder)
             output_path.mkdir(parents=True, exist_ok=True)
-            writer = CSVWriter()
+            writer = _get_writer()
 
-        # Make the API call
+        # Make the API call; the client takes plain lists of currency codes
         results = await client.get_rates_async(
-            source=rate_request.source,
-            currencies=rate_request.currencies,
-            output_path=output_path if rate_request.save_to_file else None,
+            sources=list[str](rate_request.source),
+            currencies=list[str](rate_request.currencies),
+            output_path=output_path,
             writer=writer
         )
 
-        return results  # type: ignore
+        return Response(content=orjson.dumps(results), media_type="application/json")
 
-    except ImportError as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"GetYuhRates package not available: {str(e)}"
-        )
+    except GetYuhRatesUnavailableError as e:
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
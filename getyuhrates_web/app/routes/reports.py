@@ -1,49 +1,131 @@
 """Routes for report management."""
 
+import heapq
 import os
+from collections.abc import Iterator
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response
 
 from ..models.responses import MessageResponse, ReportInfo
-from ..config import get_reports_dir
+from ..config import AppConfig, get_app_config, get_reports_dir
+from ..templates_env import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
 
 
-def get_report_files() -> list[dict[str, Any]]:
-    """Get list of all report files with metadata.
+# A report file as (modified timestamp, filename, size in bytes, path)
+type ReportEntry = tuple[float, str, int, str]
+
+
+def _scan_reports(reports_dir: Path) -> Iterator[ReportEntry]:
+    """Yield the report files in a directory.
+
+    Args:
+        reports_dir (Path): Directory containing the reports.
+
+    Yields:
+        ReportEntry: One entry per file, in directory order. Nothing is
+            yielded if the directory doesn't exist.
+    """
+    # scandir gets each entry's type from the directory listing itself, so
+    # only one stat call is needed per file
+    try:
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    yield (stat.st_mtime, entry.name, stat.st_size, entry.path)
+    except FileNotFoundError:
+        return
+
+
+def _report_info(report: ReportEntry) -> dict[str, Any]:
+    """Build the report information dictionary for a report file.
+
+    Args:
+        report (ReportEntry): The report file.
+
+    Returns:
+        dict[str, Any]: Report information dictionary.
+    """
+    mtime, filename, size, path = report
+    return {
+        "filename": filename,
+        "size": size,
+        "modified": datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"),
+        "path": path,
+    }
+
+
+def _resolve_report_path(app_config: AppConfig, filename: str) -> Path:
+    """Get the path of a report file, rejecting paths outside the reports directory.
+
+    Args:
+        app_config (AppConfig): Configuration of the running application.
+        filename (str): Name of the report file.
+
+    Returns:
+        Path: Resolved path to the report file.
+
+    Raises:
+        HTTPException: If the filename does not name a file directly inside
+            the reports directory.
+    """
+    # Security check: prevent directory traversal. Resolving collapses ".."
+    # and follows symlinks, so the result must sit directly in the directory.
+    reports_dir = get_reports_dir(app_config).resolve()
+    try:
+        file_path = (reports_dir / filename).resolve()
+    except (OSError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid filename") from None
+
+    if file_path.parent != reports_dir:
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
+    return file_path
+
+
+def get_report_files(app_config: AppConfig) -> list[dict[str, Any]]:
+    """Get list of all report files with metadata, newest first.
+
+    Args:
+        app_config (AppConfig): Configuration of the running application.
 
     Returns:
         list[dict[str, Any]]: List of report information dictionaries.
     """
-    reports_dir = get_reports_dir()
-    reports = []
+    reports = list(_scan_reports(get_reports_dir(app_config)))
+
+    # Sort by the raw modified time, newest first
+    reports.sort(key=itemgetter(0), reverse=True)
+
+    return [_report_info(report) for report in reports]
 
-    if not reports_dir.exists():
-        return reports
 
-    for file_path in reports_dir.iterdir():
-        if file_path.is_file():
-            stat = file_path.stat()
-            modified_time = datetime.fromtimestamp(stat.st_mtime)
+def get_recent_reports(app_config: AppConfig, n: int) -> list[dict[str, Any]]:
+    """Get the most recently modified report files with metadata, newest first.
 
-            reports.append({
-                "filename": file_path.name,
-                "size": stat.st_size,
-                "modified": modified_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "path": str(file_path),
-            })
+    Unlike get_report_files, this neither sorts nor keeps the whole listing,
+    and only formats the timestamps of the returned reports.
 
-    # Sort by modified time, newest first
-    reports.sort(key=lambda x: x["modified"], reverse=True)
+    Args:
+        app_config (AppConfig): Configuration of the running application.
+        n (int): Maximum number of reports to return.
 
-    return reports
+    Returns:
+        list[dict[str, Any]]: List of report information dictionaries.
+    """
+    recent = heapq.nlargest(
+        n, _scan_reports(get_reports_dir(app_config)), key=itemgetter(0)
+    )
+    return [_report_info(report) for report in recent]
 
 
 @router.get("/reports", response_class=HTMLResponse)
@@ -56,7 +138,7 @@ async def reports_page(request: Request) -> Any:
     Returns:
         Any: Rendered HTML template.
     """
-    reports = get_report_files()
+    reports = get_report_files(await get_app_config(request))
 
     return templates.TemplateResponse(
         "reports.html",
@@ -68,11 +150,12 @@ async def reports_page(request: Request) -> Any:
 
 
 @router.get("/reports/download/{filename}")
-async def download_report(filename: str) -> FileResponse:
+async def download_report(filename: str, request: Request) -> FileResponse:
     """Download a specific report file.
 
     Args:
         filename (str): Name of the file to download.
+        request (Request): The HTTP request object.
 
     Returns:
         FileResponse: The file to download.
@@ -80,29 +163,33 @@ async def download_report(filename: str) -> FileResponse:
     Raises:
         HTTPException: If file not found or invalid filename.
     """
-    # Security check: prevent directory traversal
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise HTTPException(status_code=400, detail="Invalid filename")
+    file_path = _resolve_report_path(await get_app_config(request), filename)
 
-    reports_dir = get_reports_dir()
-    file_path = reports_dir / filename
+    # Stat the file once, and hand the result to FileResponse so it doesn't
+    # stat the file again before sending it
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Report not found") from None
 
-    if not file_path.exists() or not file_path.is_file():
+    if not S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="Report not found")
 
     return FileResponse(
         path=str(file_path),
         filename=filename,
-        media_type="application/octet-stream"
+        media_type="application/octet-stream",
+        stat_result=stat_result,
     )
 
 
 @router.delete("/reports/delete/{filename}", response_model=MessageResponse)
-async def delete_report(filename: str) -> dict[str, Any]:
+async def delete_report(filename: str, request: Request) -> dict[str, Any]:
     """Delete a specific report file.
 
     Args:
         filename (str): Name of the file to delete.
+        request (Request): The HTTP request object.
 
     Returns:
         dict[str, Any]: Success message.
@@ -110,12 +197,7 @@ async def delete_report(filename: str) -> dict[str, Any]:
     Raises:
         HTTPException: If file not found or invalid filename.
     """
-    # Security check: prevent directory traversal
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise HTTPException(status_code=400, detail="Invalid filename")
-
-    reports_dir = get_reports_dir()
-    file_path = reports_dir / filename
+    file_path = _resolve_report_path(await get_app_config(request), filename)
 
     if not file_path.exists() or not file_path.is_file():
         raise HTTPException(status_code=404, detail="Report not found")
@@ -133,11 +215,23 @@ async def delete_report(filename: str) -> dict[str, Any]:
         )
 
 
-@router.get("/reports/list", response_model=list[ReportInfo])
-async def list_reports() -> list[dict[str, Any]]:
+# The listing is built here from stat results, so it's already in the shape of
+# ReportInfo; the model is only used to document the response, and the data
+# is serialised directly with orjson instead of being validated again
+@router.get(
+    "/reports/list",
+    response_model=None,
+    response_class=JSONResponse,
+    responses={200: {"model": list[ReportInfo]}},
+)
+async def list_reports(request: Request) -> Response:
     """Get list of all reports as JSON.
 
+    Args:
+        request (Request): The HTTP request object.
+
     Returns:
-        list[dict[str, Any]]: List of report information.
+        Response: List of report information as JSON.
     """
-    return get_report_files()
+    reports = get_report_files(await get_app_config(request))
+    return Response(content=orjson.dumps(reports), media_type="application/json")
@@ -0,0 +1,34 @@
+"""Shared Jinja2 template environment for the web application."""
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+TEMPLATES_DIR = "app/templates"
+
+# Templates loaded at startup: the page templates rendered by the routes and
+# the base template they extend, which Jinja would otherwise load on first render
+PRELOADED_TEMPLATES: tuple[str, ...] = (
+    "base.html",
+    "index.html",
+    "rates.html",
+    "config.html",
+    "reports.html",
+)
+
+# Templates are only read from disk once: with auto_reload off Jinja doesn't
+# stat the file on every render, and an unbounded cache never evicts them.
+# Changes to the templates are picked up on restart.
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+        cache_size=-1,
+    )
+)
+
+
+def preload_templates() -> None:
+    """Load and compile the templates into the template cache."""
+    for name in PRELOADED_TEMPLATES:
+        _ = templates.get_template(name)
@@ -1,16 +1,40 @@
 """Entry point for the GetYuhRates web application.
 
 Run this file with: fastapi dev main.py (development) or fastapi run main.py (production)
+
+Running it directly with `python main.py` starts uvicorn with auto-reload,
+unless GETYUHRATES_WEB_ENV is set to "production".
 """
 
+import os
+import sys
+
+from app.config import load_env
 from app.main import app
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
+    load_env()
+
+    if os.getenv("GETYUHRATES_WEB_ENV", "development").lower() == "production":
+        # Use the C implementations of the event loop and HTTP parser, both
+        # installed by uvicorn[standard]; uvloop isn't available on Windows.
+        # Each worker process keeps its own configuration snapshot and rate
+        # limiter, so run more than one only if that's acceptable.
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            workers=int(os.getenv("GETYUHRATES_WEB_WORKERS", "1") or "1"),
+            reload=False
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True
+        )
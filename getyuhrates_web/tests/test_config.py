@@ -0,0 +1,140 @@
+"""Tests for the AppConfig snapshot.
+
+This module contains tests to verify how parsed config.yaml data is read.
+"""
+
+import pytest
+import yaml
+
+from app.config import AppConfig, ConfigValidationError
+
+LIST_FIELDS: tuple[str, ...] = ("source", "currencies", "recipients")
+TEXT_FIELDS: tuple[str, ...] = (
+    "always_download",
+    "output_folder",
+    "output_format",
+    "sender_email",
+    "subject_title",
+    "email_body",
+)
+
+
+def test_null_recipients_uses_default() -> None:
+    """Test that a recipients key with no value gives no recipients.
+
+    This test verifies that `recipients:` left empty in config.yaml is read
+    as an empty tuple instead of failing.
+    """
+    app_config = AppConfig.from_dict({"recipients": None})
+
+    assert app_config.recipients == ()
+
+
+def test_string_source_is_single_currency() -> None:
+    """Test that a source given as a plain string is read as one currency.
+
+    This test verifies that `source: USD` is not split into characters.
+    """
+    app_config = AppConfig.from_dict({"source": "USD", "currencies": "EUR"})
+
+    assert app_config.source == ("USD",)
+    assert app_config.currencies == ("EUR",)
+
+
+def test_null_output_folder_uses_default() -> None:
+    """Test that an output_folder key with no value keeps the default folder.
+
+    This test verifies that `output_folder:` left empty in config.yaml is not
+    read as the string "None".
+    """
+    app_config = AppConfig.from_dict({"output_folder": None})
+
+    assert app_config.output_folder == AppConfig().output_folder
+
+
+@pytest.mark.parametrize("value", [{"code": "USD"}, 5])
+def test_non_list_value_is_rejected(value: object) -> None:
+    """Test that a list setting holding another type raises a config error.
+
+    This test verifies that the error names the offending setting.
+    """
+    with pytest.raises(ConfigValidationError, match="'source'"):
+        _ = AppConfig.from_dict({"source": value})
+
+
+def test_list_values_are_read_as_tuples() -> None:
+    """Test that list settings are read into tuples.
+
+    This test verifies the structure of a fully specified configuration.
+    """
+    app_config = AppConfig.from_dict(
+        {
+            "source": ["USD", "GBP"],
+            "currencies": ["EUR", "BBD"],
+            "recipients": ["a@example.com"],
+            "output_folder": "./out/",
+        }
+    )
+
+    assert app_config.source == ("USD", "GBP")
+    assert app_config.currencies == ("EUR", "BBD")
+    assert app_config.recipients == ("a@example.com",)
+    assert app_config.output_folder == "./out/"
+
+
+@pytest.mark.parametrize("field", LIST_FIELDS)
+@pytest.mark.parametrize("value", [None, []])
+def test_empty_list_setting_uses_default(field: str, value: list[str] | None) -> None:
+    """Test that every list setting left empty keeps its default value.
+
+    This test verifies that a null or empty list is never stored as-is.
+    """
+    app_config = AppConfig.from_dict({field: value})
+
+    assert getattr(app_config, field) == getattr(AppConfig(), field)
+
+
+@pytest.mark.parametrize("field", LIST_FIELDS)
+def test_string_list_setting_is_single_item(field: str) -> None:
+    """Test that every list setting given as a plain string holds one item.
+
+    This test verifies that the string is not split into characters.
+    """
+    app_config = AppConfig.from_dict({field: "user@mail.com"})
+
+    assert getattr(app_config, field) == ("user@mail.com",)
+
+
+@pytest.mark.parametrize("field", TEXT_FIELDS)
+def test_null_text_setting_uses_default(field: str) -> None:
+    """Test that every text setting with no value keeps its default value.
+
+    This test verifies that None is never stored as the string "None".
+    """
+    app_config = AppConfig.from_dict({field: None})
+
+    assert getattr(app_config, field) == getattr(AppConfig(), field)
+
+
+def test_parsed_yaml_with_empty_and_single_values() -> None:
+    """Test reading a config.yaml that uses empty keys and single strings.
+
+    This test verifies the values produced from YAML as it is written by hand.
+    """
+    config = yaml.safe_load(
+        "source: GBP\n"
+        "currencies:\n"
+        "  - EUR\n"
+        "  - BBD\n"
+        "output_folder:\n"
+        "recipients:\n"
+        "sender_email:\n"
+    )
+
+    app_config = AppConfig.from_dict(config)
+
+    assert app_config.source == ("GBP",)
+    assert app_config.currencies == ("EUR", "BBD")
+    assert app_config.output_folder == "./reports/"
+    assert app_config.recipients == ()
+    assert app_config.sender_email == ""